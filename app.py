@@ -8,30 +8,52 @@ Run locally:
 """
 from __future__ import annotations
 
+import functools
+import hashlib
+import hmac
+import importlib.util
 import io
+import math
 import os
-from datetime import datetime, timedelta
-from typing import Optional
+import re
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping, NamedTuple, Optional
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-# Import Plotly for interactive charts
-try:
-    import plotly.graph_objects as go
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+# Plotly is imported lazily so the login screen doesn't pay for it
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+_go = None
+
+
+def _get_plotly():
+    """Return plotly.graph_objects, importing it on first use."""
+    global _go
+    if _go is None:
+        import plotly.graph_objects as _go
+    return _go
 
 # Import the core report logic
 from asana_daily_report import (
     Config,
+    AsanaClient,
     AsanaComplianceReporter,
     TaskCompliance,
     ReportSummary,
     MarkdownReportGenerator,
     JSONReportGenerator,
     OPENPYXL_AVAILABLE,
+    natural_sort_key,
+    order_statuses,
+    shorten,
 )
 
 # =============================================================================
@@ -45,666 +67,92 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-# Neumorphism Design System CSS
-st.markdown("""
-<style>
-    /* =================================================================
-       DESIGN TOKENS - Neumorphism (Soft UI) System
-       ================================================================= */
-    :root {
-        /* Base Colors */
-        --nm-bg: #E4E8EC;
-        --nm-surface: #E4E8EC;
-        --nm-shadow-dark: #A3B1C6;
-        --nm-shadow-light: #FFFFFF;
-
-        /* Semantic Accents (Muted) */
-        --nm-primary: #6B7FD7;
-        --nm-success: #5B9A8B;
-        --nm-warning: #D4A574;
-        --nm-error: #C9736D;
-        --nm-info: #5A9AA8;
-
-        /* Text Colors */
-        --nm-text-primary: #2D3748;
-        --nm-text-secondary: #5A6778;
-        --nm-text-muted: #8896A4;
-
-        /* Shadow Patterns */
-        --nm-shadow-raised: 6px 6px 12px #A3B1C6, -6px -6px 12px #FFFFFF;
-        --nm-shadow-inset: inset 3px 3px 6px #A3B1C6, inset -3px -3px 6px #FFFFFF;
-        --nm-shadow-pressed: inset 2px 2px 5px #A3B1C6, inset -2px -2px 5px #FFFFFF;
-        --nm-shadow-hover: 10px 10px 20px #A3B1C6, -10px -10px 20px #FFFFFF;
-    }
-
-    /* =================================================================
-       GLOBAL STYLES
-       ================================================================= */
-    .stApp {
-        background: var(--nm-bg) !important;
-    }
-
-    [data-testid="stSidebar"] {
-        background: #D8DCE2 !important;
-    }
-
-    [data-testid="stSidebar"] [data-testid="stMarkdown"] {
-        color: var(--nm-text-primary);
-    }
-
-    /* =================================================================
-       METRIC CARDS - Neumorphic Style
-       ================================================================= */
-    .nm-card {
-        background: var(--nm-bg);
-        border-radius: 16px;
-        padding: 24px 20px 20px 20px;
-        text-align: center;
-        margin-bottom: 1rem;
-        box-shadow: var(--nm-shadow-raised);
-        position: relative;
-        overflow: hidden;
-        transition: box-shadow 0.25s ease;
-    }
-
-    .nm-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: var(--nm-primary);
-        border-radius: 16px 16px 0 0;
-    }
-
-    .nm-card:hover {
-        box-shadow: var(--nm-shadow-hover);
-    }
-
-    .nm-card--success::before { background: var(--nm-success); }
-    .nm-card--warning::before { background: var(--nm-error); }
-    .nm-card--info::before { background: var(--nm-info); }
-
-    .nm-card-value {
-        font-size: 2.25rem;
-        font-weight: 700;
-        color: var(--nm-text-primary);
-        margin: 0;
-        line-height: 1.2;
-    }
-
-    .nm-card-label {
-        font-size: 0.9rem;
-        color: var(--nm-text-secondary);
-        margin-top: 8px;
-        font-weight: 500;
-    }
-
-    /* =================================================================
-       ALERT SECTIONS - Neumorphic Style with Colored Backgrounds
-       ================================================================= */
-    .nm-alert {
-        background: var(--nm-bg);
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin-bottom: 1.5rem;
-        box-shadow: var(--nm-shadow-raised);
-        border-left: 5px solid var(--nm-info);
-        position: relative;
-        overflow: hidden;
-    }
-
-    /* Critical/Error Alert - Soft rose/coral tint */
-    .nm-alert--error {
-        background: linear-gradient(135deg, #F0E4E4 0%, #E8DCDC 100%);
-        border-left-color: var(--nm-error);
-        box-shadow:
-            6px 6px 12px rgba(163, 145, 145, 0.5),
-            -6px -6px 12px rgba(255, 255, 255, 0.8),
-            inset 0 1px 0 rgba(255, 255, 255, 0.6);
-    }
-
-    .nm-alert--error::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        right: 0;
-        width: 100px;
-        height: 100px;
-        background: radial-gradient(circle at top right, rgba(201, 115, 109, 0.15), transparent 70%);
-        pointer-events: none;
-    }
-
-    .nm-alert--error h3 {
-        color: #8B4C47;
-    }
-
-    .nm-alert--error p {
-        color: #6B5A58;
-    }
-
-    /* Warning/Amber Alert - Soft warm amber tint */
-    .nm-alert--warning {
-        background: linear-gradient(135deg, #F2EBE0 0%, #EAE2D6 100%);
-        border-left-color: var(--nm-warning);
-        box-shadow:
-            6px 6px 12px rgba(163, 155, 140, 0.5),
-            -6px -6px 12px rgba(255, 255, 255, 0.8),
-            inset 0 1px 0 rgba(255, 255, 255, 0.6);
-    }
-
-    .nm-alert--warning::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        right: 0;
-        width: 100px;
-        height: 100px;
-        background: radial-gradient(circle at top right, rgba(212, 165, 116, 0.15), transparent 70%);
-        pointer-events: none;
-    }
-
-    .nm-alert--warning h3 {
-        color: #7A6340;
-    }
-
-    .nm-alert--warning p {
-        color: #6B6055;
-    }
-
-    .nm-alert h3 {
-        color: var(--nm-text-primary);
-        margin: 0 0 0.5rem 0;
-        font-weight: 600;
-        font-size: 1.1rem;
-    }
-
-    .nm-alert p {
-        color: var(--nm-text-secondary);
-        margin: 0 0 1rem 0;
-        font-size: 0.9rem;
-    }
-
-    /* =================================================================
-       COMPLIANCE DETAILS SECTION - Soft blue/purple tint
-       ================================================================= */
-    .nm-section-compliance {
-        background: linear-gradient(135deg, #E4E8F0 0%, #DCE2EC 100%);
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin-bottom: 1.5rem;
-        box-shadow:
-            6px 6px 12px rgba(140, 155, 180, 0.4),
-            -6px -6px 12px rgba(255, 255, 255, 0.8),
-            inset 0 1px 0 rgba(255, 255, 255, 0.6);
-        border-left: 5px solid var(--nm-primary);
-        position: relative;
-        overflow: hidden;
-    }
-
-    .nm-section-compliance::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        right: 0;
-        width: 120px;
-        height: 120px;
-        background: radial-gradient(circle at top right, rgba(107, 127, 215, 0.12), transparent 70%);
-        pointer-events: none;
-    }
-
-    .nm-section-compliance h3 {
-        color: #4A5580;
-        margin: 0 0 0.5rem 0;
-        font-weight: 600;
-        font-size: 1.1rem;
-    }
-
-    .nm-section-compliance p {
-        color: #5A6778;
-        margin: 0;
-        font-size: 0.9rem;
-    }
-
-    /* =================================================================
-       BUTTONS - Neumorphic Style
-       ================================================================= */
-    .stButton > button {
-        background: var(--nm-bg) !important;
-        border: none !important;
-        border-radius: 10px !important;
-        box-shadow: var(--nm-shadow-raised) !important;
-        color: var(--nm-text-primary) !important;
-        font-weight: 500 !important;
-        transition: all 0.15s ease !important;
-    }
-
-    .stButton > button:hover {
-        box-shadow: var(--nm-shadow-hover) !important;
-        color: var(--nm-primary) !important;
-    }
-
-    .stButton > button:active {
-        box-shadow: var(--nm-shadow-pressed) !important;
-    }
+# Neumorphism Design System CSS (static/neumorphism.css, also holds the login styles).
+# Production serves the minified build from build_css.py.
+STATIC_DIR = Path(__file__).parent / "static"
+CSS_PATH = STATIC_DIR / "neumorphism.css"
+CSS_MIN_PATH = STATIC_DIR / "neumorphism.min.css"
 
-    .stButton > button[kind="primary"] {
-        background: var(--nm-bg) !important;
-        color: var(--nm-primary) !important;
-    }
 
-    .stButton > button[kind="primary"]::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 3px;
-        background: var(--nm-primary);
-        border-radius: 10px 10px 0 0;
-    }
-
-    /* =================================================================
-       INPUTS - Neumorphic Inset Style
-       ================================================================= */
-    .stTextInput > div > div > input,
-    .stSelectbox > div > div,
-    .stMultiSelect > div > div,
-    .stNumberInput > div > div > input {
-        background: var(--nm-bg) !important;
-        border: none !important;
-        border-radius: 8px !important;
-        box-shadow: var(--nm-shadow-inset) !important;
-        color: var(--nm-text-primary) !important;
-    }
+def _is_prod() -> bool:
+    """True when APP_ENV (environment or secrets) is "prod"."""
+    env = os.environ.get("APP_ENV")
+    # Only touch st.secrets when a secrets.toml exists: reading it otherwise
+    # shows a "No secrets found" error banner
+    if env is None and st.secrets.load_if_toml_exists():
+        env = st.secrets.get("APP_ENV")
+    return env == "prod"
 
-    .stTextInput > div > div > input:focus,
-    .stNumberInput > div > div > input:focus {
-        box-shadow: var(--nm-shadow-inset), 0 0 0 3px rgba(107, 127, 215, 0.3) !important;
-    }
 
-    /* Dropdown/Select cursor pointer */
-    .stSelectbox > div > div,
-    .stSelectbox [data-baseweb="select"],
-    .stSelectbox [data-baseweb="select"] > div,
-    .stMultiSelect > div > div,
-    .stMultiSelect [data-baseweb="select"],
-    .stMultiSelect [data-baseweb="select"] > div {
-        cursor: pointer !important;
-    }
+@st.cache_resource
+def _css_block() -> str:
+    """The design system stylesheet as a <style> block, read and wrapped once per process."""
+    css_path = CSS_MIN_PATH if _is_prod() and CSS_MIN_PATH.exists() else CSS_PATH
+    return f"<style>{css_path.read_text()}</style>"
 
-    /* =================================================================
-       EXPANDERS - Clean borderless style
-       ================================================================= */
-    div[data-testid="stExpander"] {
-        background: var(--nm-bg) !important;
-        border: none !important;
-        border-radius: 12px !important;
-        box-shadow: none !important;
-        overflow: hidden;
-    }
 
-    div[data-testid="stExpander"] > details {
-        border: none !important;
-    }
+# Re-emitted every run (elements a run doesn't draw are removed), but as raw
+# HTML: st.html skips the markdown parse st.markdown would do on each rerun
+st.html(_css_block())
 
-    div[data-testid="stExpander"] > details > summary {
-        background: transparent !important;
-        color: var(--nm-text-primary) !important;
-        font-weight: 500;
-        border: none !important;
-    }
 
-    div[data-testid="stExpander"] > details[open] > summary {
-        border: none !important;
-        border-bottom: none !important;
-    }
-
-    /* Remove any outline/border on expander focus */
-    div[data-testid="stExpander"] *:focus {
-        outline: none !important;
-        box-shadow: none !important;
-    }
-
-    /* =================================================================
-       SEVERITY-COLORED EXPANDER WRAPPERS
-       ================================================================= */
-
-    /* Critical/Red severity - soft coral/rose */
-    .nm-expander-red {
-        background: linear-gradient(135deg, #F0E4E4 0%, #E8DCDC 100%);
-        border-radius: 14px;
-        padding: 4px;
-        margin-bottom: 12px;
-        box-shadow:
-            5px 5px 10px rgba(163, 145, 145, 0.4),
-            -5px -5px 10px rgba(255, 255, 255, 0.7),
-            inset 0 1px 0 rgba(255, 255, 255, 0.5);
-        border-left: 4px solid var(--nm-error);
-    }
-
-    .nm-expander-red div[data-testid="stExpander"] {
-        background: transparent !important;
-    }
-
-    .nm-expander-red div[data-testid="stExpander"] > details > summary {
-        color: #8B4C47 !important;
-    }
-
-    /* Warning/Orange severity - soft peach/orange */
-    .nm-expander-orange {
-        background: linear-gradient(135deg, #F5EBE0 0%, #EDE3D6 100%);
-        border-radius: 14px;
-        padding: 4px;
-        margin-bottom: 12px;
-        box-shadow:
-            5px 5px 10px rgba(170, 155, 140, 0.4),
-            -5px -5px 10px rgba(255, 255, 255, 0.7),
-            inset 0 1px 0 rgba(255, 255, 255, 0.5);
-        border-left: 4px solid #D4885C;
-    }
-
-    .nm-expander-orange div[data-testid="stExpander"] {
-        background: transparent !important;
-    }
-
-    .nm-expander-orange div[data-testid="stExpander"] > details > summary {
-        color: #8B5A3C !important;
-    }
-
-    /* Caution/Yellow severity - soft cream/yellow */
-    .nm-expander-yellow {
-        background: linear-gradient(135deg, #F5F0E0 0%, #EDE8D4 100%);
-        border-radius: 14px;
-        padding: 4px;
-        margin-bottom: 12px;
-        box-shadow:
-            5px 5px 10px rgba(170, 165, 140, 0.4),
-            -5px -5px 10px rgba(255, 255, 255, 0.7),
-            inset 0 1px 0 rgba(255, 255, 255, 0.5);
-        border-left: 4px solid #C9A84C;
-    }
-
-    .nm-expander-yellow div[data-testid="stExpander"] {
-        background: transparent !important;
-    }
-
-    .nm-expander-yellow div[data-testid="stExpander"] > details > summary {
-        color: #7A6830 !important;
-    }
-
-    /* =================================================================
-       DATA ROWS - Neumorphic Style
-       ================================================================= */
-    .nm-data-row {
-        background: var(--nm-bg);
-        border-radius: 12px;
-        padding: 16px;
-        margin-bottom: 12px;
-        box-shadow: var(--nm-shadow-raised);
-        transition: box-shadow 0.25s ease;
-    }
-
-    .nm-data-row:hover {
-        box-shadow: var(--nm-shadow-hover);
-    }
-
-    /* =================================================================
-       SIDEBAR SECTIONS
-       ================================================================= */
-    .nm-sidebar-section {
-        background: var(--nm-bg);
-        border-radius: 12px;
-        padding: 16px;
-        margin-bottom: 16px;
-        box-shadow: var(--nm-shadow-raised);
-    }
-
-    /* =================================================================
-       LOADING & UTILITY STYLES
-       ================================================================= */
-    .loading-text {
-        font-size: 1.1rem;
-        color: var(--nm-primary);
-        padding: 1rem;
-    }
-
-    /* Status indicators */
-    [data-testid="stStatus"] {
-        background: var(--nm-bg) !important;
-        border-radius: 12px !important;
-        box-shadow: var(--nm-shadow-raised) !important;
-        border: none !important;
-    }
-
-    /* Metrics */
-    [data-testid="stMetric"] {
-        background: var(--nm-bg);
-        border-radius: 12px;
-        padding: 16px;
-        box-shadow: var(--nm-shadow-raised);
-    }
-
-    [data-testid="stMetric"] label {
-        color: var(--nm-text-secondary) !important;
-    }
-
-    [data-testid="stMetric"] [data-testid="stMetricValue"] {
-        color: var(--nm-text-primary) !important;
-    }
-
-    /* Dividers */
-    hr {
-        border-color: rgba(163, 177, 198, 0.3) !important;
-    }
-
-    /* Links */
-    a {
-        color: var(--nm-primary) !important;
-    }
-
-    a:hover {
-        color: var(--nm-info) !important;
-    }
-
-    /* Captions */
-    .stCaption, [data-testid="stCaptionContainer"] {
-        color: var(--nm-text-muted) !important;
-    }
-
-    /* Headers */
-    h1, h2, h3 {
-        color: var(--nm-text-primary) !important;
-    }
-
-    /* Dialogs/Modals */
-    [data-testid="stModal"] > div {
-        background: var(--nm-bg) !important;
-        border-radius: 16px !important;
-        box-shadow: 12px 12px 24px #A3B1C6, -12px -12px 24px #FFFFFF !important;
-    }
-
-    /* Download buttons */
-    .stDownloadButton > button {
-        background: var(--nm-bg) !important;
-        border: none !important;
-        border-radius: 10px !important;
-        box-shadow: var(--nm-shadow-raised) !important;
-        color: var(--nm-text-primary) !important;
-    }
-
-    .stDownloadButton > button:hover {
-        box-shadow: var(--nm-shadow-hover) !important;
-        color: var(--nm-primary) !important;
-    }
-
-    /* Checkbox and Radio */
-    .stCheckbox > label > span,
-    .stRadio > label > span {
-        color: var(--nm-text-primary) !important;
-    }
-
-    /* Info/Warning/Error boxes */
-    .stAlert {
-        background: var(--nm-bg) !important;
-        border-radius: 12px !important;
-        box-shadow: var(--nm-shadow-raised) !important;
-        border-left: 4px solid var(--nm-info) !important;
-    }
-
-    /* Text area */
-    .stTextArea > div > div > textarea {
-        background: var(--nm-bg) !important;
-        border: none !important;
-        border-radius: 8px !important;
-        box-shadow: var(--nm-shadow-inset) !important;
-        color: var(--nm-text-primary) !important;
-    }
-
-    /* Dataframe - remove outer border, keep internal grid */
-    [data-testid="stDataFrame"] {
-        background: var(--nm-bg) !important;
-        border-radius: 0 !important;
-        box-shadow: none !important;
-        border: none !important;
-        overflow: visible;
-    }
-
-    [data-testid="stDataFrame"] > div {
-        border: none !important;
-        box-shadow: none !important;
-    }
-
-    /* Remove outer border from table container */
-    [data-testid="stDataFrame"] iframe {
-        border: none !important;
-    }
-
-    /* Style the table inside dataframe */
-    [data-testid="stDataFrame"] table {
-        border-collapse: collapse !important;
-        border: none !important;
-    }
-
-    [data-testid="stDataFrame"] th,
-    [data-testid="stDataFrame"] td {
-        border-left: none !important;
-        border-right: none !important;
-        border-top: 1px solid rgba(163, 177, 198, 0.3) !important;
-        border-bottom: 1px solid rgba(163, 177, 198, 0.3) !important;
-    }
-
-    [data-testid="stDataFrame"] tr:first-child th,
-    [data-testid="stDataFrame"] tr:first-child td {
-        border-top: none !important;
-    }
-
-    [data-testid="stDataFrame"] tr:last-child th,
-    [data-testid="stDataFrame"] tr:last-child td {
-        border-bottom: none !important;
-    }
-
-    /* Accessibility - Focus states */
-    *:focus-visible {
-        outline: 3px solid var(--nm-primary) !important;
-        outline-offset: 2px;
-    }
-
-    /* Reduced motion preference */
-    @media (prefers-reduced-motion: reduce) {
-        *, *::before, *::after {
-            transition: none !important;
-            animation: none !important;
-        }
-    }
-
-    /* =================================================================
-       SPRINT PROGRESS BAR - Neumorphic Style (Quick Wins)
-       ================================================================= */
-    .nm-progress-container {
-        background: var(--nm-bg);
-        border-radius: 20px;
-        padding: 24px;
-        margin-bottom: 1.5rem;
-        box-shadow: var(--nm-shadow-raised);
-    }
-
-    .nm-progress-bar-outer {
-        background: var(--nm-bg);
-        border-radius: 12px;
-        height: 24px;
-        box-shadow: var(--nm-shadow-inset);
-        overflow: hidden;
-        position: relative;
-    }
-
-    .nm-progress-bar-inner {
-        height: 100%;
-        border-radius: 12px;
-        background: linear-gradient(90deg, var(--nm-primary) 0%, var(--nm-success) 100%);
-        box-shadow: 0 2px 8px rgba(107, 127, 215, 0.4);
-        transition: width 0.6s ease;
-    }
-
-    .nm-progress-text {
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        transform: translate(-50%, -50%);
-        font-weight: 600;
-        font-size: 0.85rem;
-        color: var(--nm-text-primary);
-        text-shadow: 0 1px 2px rgba(255,255,255,0.8);
-    }
-
-    .nm-progress-stats {
-        display: flex;
-        justify-content: space-between;
-        margin-top: 12px;
-        font-size: 0.9rem;
-        color: var(--nm-text-secondary);
-    }
-</style>
-""", unsafe_allow_html=True)
+# Severity -> data-severity preset for .nm-expander wrappers
+# (<div class="nm-expander" data-severity="...">)
+_SEVERITY_ATTR: Mapping[str, str] = MappingProxyType({
+    "critical": "red",
+    "warning": "orange",
+    "caution": "yellow",
+})
 
 
 # =============================================================================
 # Session State
 # =============================================================================
 
+_SESSION_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    "authenticated": False,
+    "auth_failed": False,
+    "results": None,
+    "completed_results": None,
+    "completed_task_index": None,
+    "task_index": None,
+    "results_frame": None,
+    "filtered_view": None,
+    "summary": None,
+    "tasks_df": None,
+    "config": None,
+    "report_generated": False,
+    "selected_task_gid": None,
+    "selected_task_url": None,
+    "selected_task_name": None,
+    "downloads_prepared_for": None,
+    "applied_filters": None,
+    "filters_auto_apply": False,
+})
+_SESSION_INIT_KEY = "_ssh_initialized"
+
+
 def init_session_state():
-    """Initialize session state variables."""
-    defaults = {
-        "authenticated": False,
-        "auth_failed": False,
-        "results": None,
-        "completed_results": None,
-        "summary": None,
-        "config": None,
-        "reporter": None,
-        "report_generated": False,
-        "is_generating": False,
-        "selected_task_gid": None,
-        "selected_task_url": None,
-        "selected_task_name": None,
-    }
-    for key, value in defaults.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
+    """Initialize session state variables (once per session)."""
+    if st.session_state.get(_SESSION_INIT_KEY):
+        return
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
+    st.session_state[_SESSION_INIT_KEY] = True
 
 
 # =============================================================================
 # Authentication
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_app_passcode() -> Optional[str]:
-    """Get the app passcode from secrets or environment."""
-    try:
-        if "APP_PASSCODE" in st.secrets:
-            return st.secrets["APP_PASSCODE"]
-    except FileNotFoundError:
-        pass
+    """Get the app passcode from secrets or environment (read once per process)."""
+    # Only touch st.secrets when a secrets.toml exists (see _is_prod)
+    if st.secrets.load_if_toml_exists():
+        passcode = st.secrets.get("APP_PASSCODE")
+        if passcode:
+            return passcode
     return os.environ.get("APP_PASSCODE")
 
 
@@ -714,119 +162,56 @@ def check_passcode(entered_passcode: str) -> bool:
     if not correct_passcode:
         # No passcode configured - allow access
         return True
-    return entered_passcode == correct_passcode
+    # str(): a bare TOML integer (APP_PASSCODE = 1234) comes back as an int
+    return hmac.compare_digest(entered_passcode.encode(), str(correct_passcode).encode())
 
 
-def render_login_screen():
-    """Render a beautiful neumorphic login screen."""
-    # Center the login form
-    st.markdown("""
-    <style>
-        /* Login page specific styles */
-        .login-container {
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            min-height: 70vh;
-            padding: 20px;
-        }
+def _submit_passcode():
+    """Form callback: record the outcome of a passcode attempt."""
+    authenticated = check_passcode(st.session_state.get("passcode_input", ""))
+    st.session_state["authenticated"] = authenticated
+    st.session_state["auth_failed"] = not authenticated
 
-        .login-card {
-            background: var(--nm-bg, #E4E8EC);
-            border-radius: 24px;
-            padding: 48px 40px;
-            box-shadow:
-                12px 12px 24px #A3B1C6,
-                -12px -12px 24px #FFFFFF;
-            text-align: center;
-            max-width: 400px;
-            width: 100%;
-        }
 
-        .login-logo {
-            font-size: 3.5rem;
-            margin-bottom: 8px;
-        }
-
-        .login-title {
-            font-size: 1.8rem;
-            font-weight: 700;
-            color: #2D3748;
-            margin: 0 0 8px 0;
-        }
-
-        .login-subtitle {
-            font-size: 0.95rem;
-            color: #5A6778;
-            margin: 0 0 32px 0;
-        }
-
-        .login-error {
-            background: linear-gradient(135deg, #F0E4E4 0%, #E8DCDC 100%);
-            border-radius: 12px;
-            padding: 12px 16px;
-            margin-bottom: 20px;
-            border-left: 4px solid #C9736D;
-        }
-
-        .login-error p {
-            color: #8B4C47;
-            margin: 0;
-            font-size: 0.9rem;
-        }
+_LOGIN_CARD_HTML = """
+    <div class="login-container">
+        <div class="login-card">
+            <div class="login-logo">🔐</div>
+            <h1 class="login-title">Sprint Dashboard</h1>
+            <p class="login-subtitle">Enter passcode to continue</p>
+        </div>
+    </div>
+"""
 
-        .login-footer {
-            margin-top: 24px;
-            font-size: 0.8rem;
-            color: #8896A4;
-        }
+_LOGIN_ERROR_HTML = """
+    <div class="login-error">
+        <p>Incorrect passcode. Please try again.</p>
+    </div>
+"""
 
-        /* Style the input field */
-        .login-card .stTextInput > div > div > input {
-            text-align: center;
-            font-size: 1.2rem;
-            letter-spacing: 8px;
-            padding: 16px !important;
-        }
+_LOGIN_FOOTER_HTML = """
+    <div class="login-footer">
+        SourceHub Development Team
+    </div>
+"""
 
-        /* Style the button */
-        .login-card .stButton > button {
-            width: 100%;
-            padding: 12px 24px !important;
-            font-size: 1rem !important;
-            font-weight: 600 !important;
-            margin-top: 8px;
-        }
-    </style>
-    """, unsafe_allow_html=True)
 
+def render_login_screen():
+    """Render a beautiful neumorphic login screen."""
     # Create centered layout
     col1, col2, col3 = st.columns([1, 2, 1])
 
     with col2:
-        st.markdown("""
-        <div class="login-container">
-            <div class="login-card">
-                <div class="login-logo">🔐</div>
-                <h1 class="login-title">Sprint Dashboard</h1>
-                <p class="login-subtitle">Enter passcode to continue</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_LOGIN_CARD_HTML, unsafe_allow_html=True)
 
         # Show error message if authentication failed
         if st.session_state.get("auth_failed"):
-            st.markdown("""
-            <div class="login-error">
-                <p>Incorrect passcode. Please try again.</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_LOGIN_ERROR_HTML, unsafe_allow_html=True)
 
         # Use a form to ensure atomic submission of passcode
         with st.form("login_form", clear_on_submit=False):
             # Passcode input
-            passcode = st.text_input(
+            st.text_input(
                 "Passcode",
                 type="password",
                 placeholder="••••••",
@@ -834,24 +219,188 @@ def render_login_screen():
                 key="passcode_input"
             )
 
-            # Login button - form submission ensures passcode value is committed
-            submitted = st.form_submit_button("Unlock", type="primary", use_container_width=True)
-
-            if submitted:
-                if check_passcode(passcode):
-                    st.session_state["authenticated"] = True
-                    st.session_state["auth_failed"] = False
-                    st.rerun()
-                else:
-                    st.session_state["auth_failed"] = True
-                    st.rerun()
+            # Login button - the callback runs before the rerun, so the
+            # result is visible on the same pass (no extra st.rerun())
+            st.form_submit_button("Unlock", type="primary", use_container_width=True, on_click=_submit_passcode)
 
         # Footer
-        st.markdown("""
-        <div class="login-footer">
-            SourceHub Development Team
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_LOGIN_FOOTER_HTML, unsafe_allow_html=True)
+
+
+# =============================================================================
+# Report Generation (cached)
+# =============================================================================
+
+REPORT_CACHE_TTL_SECONDS = 600
+COMPLETED_LOOKBACK_DAYS = 30
+
+
+def hash_token(token: str) -> str:
+    """Hash an access token so the raw PAT never becomes a cache key."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def tasks_frame(results: list[TaskCompliance], completed_results: list[TaskCompliance]) -> pd.DataFrame:
+    """Columnar view of active + completed tasks for vectorised filter-option lookups."""
+    tasks = results + completed_results
+    df = pd.DataFrame({
+        "gid": [t.gid for t in tasks],
+        "sprint": [t.sprint for t in tasks],
+        "assignee": [t.assignee for t in tasks],
+        "progress": [t.progress for t in tasks],
+        "active": [True] * len(results) + [False] * len(completed_results),
+    })
+    return df.astype({"sprint": "category", "assignee": "category", "progress": "category"})
+
+
+# Fetching, comment enrichment and analysis are cached separately, so toggling
+# "Fetch Comments" or changing a threshold reuses the network results.
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _get_client(token_hash: str, *, _token: str) -> AsanaClient:
+    """One Asana API client (and its urllib3 connection pool) per token, shared by every reporter."""
+    return AsanaClient(_token, Config())
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _get_reporter(
+    token_hash: str,
+    min_desc: Optional[int] = None,
+    hrs: Optional[int] = None,
+    *,
+    _token: str,
+) -> AsanaComplianceReporter:
+    """One reporter per token and thresholds, reused across reruns and sessions."""
+    overrides = {}
+    if min_desc is not None:
+        overrides["min_description_length"] = min_desc
+    if hrs is not None:
+        overrides["hours_without_update"] = hrs
+    return AsanaComplianceReporter(_token, Config(**overrides), client=_get_client(token_hash, _token=_token))
+
+
+@st.cache_data(ttl=REPORT_CACHE_TTL_SECONDS, show_spinner=False)
+def _fetch_active_tasks(token_hash: str, _token: str) -> list[dict]:
+    """Fetch raw active tasks from Asana."""
+    client = _get_reporter(token_hash, _token=_token).client
+    return client.get_tasks(completed=False)
+
+
+# Persisted caches ignore ttl, so the day is part of the key instead: the
+# slow-changing completed-task window is fetched at most once a day per token,
+# surviving server restarts (Refresh Data still clears it)
+@st.cache_data(persist="disk", max_entries=32, show_spinner=False)
+def _fetch_completed_tasks(token_hash: str, since_days: int, day: str, _token: str) -> list[dict]:
+    """Fetch raw tasks completed in the last ``since_days`` days (as of ``day``) from Asana."""
+    client = _get_reporter(token_hash, _token=_token).client
+    return client.get_completed_tasks(since_days=since_days)
+
+
+@st.cache_data(ttl=REPORT_CACHE_TTL_SECONDS, show_spinner=False)
+def _fetch_comments(
+    token_hash: str,
+    task_gids: tuple[str, ...],
+    _token: str,
+) -> dict[str, list[dict]]:
+    """Fetch recent comments for the given tasks, keyed by task GID."""
+    client = _get_reporter(token_hash, _token=_token).client
+    return {gid: client.get_task_comments(gid, limit=5) for gid in task_gids}
+
+
+def task_fingerprint(tasks: list[dict]) -> tuple[tuple[str, str], ...]:
+    """(gid, modified_at) per task: cheap to hash, changes whenever Asana data does."""
+    return tuple((t.get("gid", ""), t.get("modified_at") or "") for t in tasks)
+
+
+@st.cache_data(ttl=REPORT_CACHE_TTL_SECONDS, show_spinner=False)
+def _score(
+    fetch_key: tuple[str, tuple, tuple],
+    fetch_comments: bool,
+    min_desc: int,
+    hrs: int,
+    _tasks: list[dict],
+    _completed_tasks: list[dict],
+    _comments: Optional[dict[str, list[dict]]],
+    _token: str,
+) -> tuple[list[TaskCompliance], list[TaskCompliance], ReportSummary, pd.DataFrame]:
+    """Run the compliance analysis on already-fetched tasks (CPU only)."""
+    analyzer = _get_reporter(fetch_key[0], min_desc, hrs, _token=_token).analyzer
+
+    results = analyzer.analyze_all(_tasks, fetch_comments=fetch_comments, comments_by_gid=_comments)
+    completed_results = []
+    if _completed_tasks:
+        completed_results = analyzer.analyze_all(
+            _completed_tasks,
+            fetch_comments=False,
+            include_done=True
+        )
+
+    summary = analyzer.generate_summary(results)
+    return results, completed_results, summary, tasks_frame(results, completed_results)
+
+
+def _run_report(
+    token: str,
+    fetch_comments: bool,
+    fetch_completed: bool,
+    min_desc: int,
+    hrs: int,
+    analyzer,
+) -> Iterator[tuple[str, Optional[tuple]]]:
+    """Fetch and analyze tasks from Asana, reusing each cached stage.
+
+    Yields ``(message, None)`` as each stage finishes so the caller can show
+    progress, then ``(message, (results, completed_results, summary, tasks_df))``.
+    """
+    token_hash = hash_token(token)
+    if fetch_completed:
+        # Independent requests: fetch both concurrently (latency is max, not sum);
+        # the worker threads need the script context for st.cache_data
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(
+            max_workers=2,
+            initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+        ) as executor:
+            tasks_future = executor.submit(_fetch_active_tasks, token_hash, _token=token)
+            completed_future = executor.submit(
+                _fetch_completed_tasks,
+                token_hash, COMPLETED_LOOKBACK_DAYS, date.today().isoformat(), _token=token,
+            )
+        tasks, completed_tasks = tasks_future.result(), completed_future.result()
+    else:
+        tasks, completed_tasks = _fetch_active_tasks(token_hash, _token=token), []
+    yield f"Fetched {len(tasks)} active and {len(completed_tasks)} completed tasks", None
+
+    comments = None
+    if fetch_comments:
+        gids = tuple(analyzer.tasks_needing_comments(tasks))
+        comments = _fetch_comments(token_hash, gids, _token=token)
+        yield f"Fetched comments for {len(gids)} active tasks", None
+
+    report = _score(
+        (token_hash, task_fingerprint(tasks), task_fingerprint(completed_tasks)),
+        fetch_comments,
+        min_desc,
+        hrs,
+        tasks,
+        completed_tasks,
+        comments,
+        _token=token,
+    )
+    yield f"Found {len(report[0])} active and {len(report[1])} completed tasks", report
+
+
+def clear_report_cache():
+    """Drop every cached report stage (used by Refresh Data)."""
+    _fetch_active_tasks.clear()
+    _fetch_completed_tasks.clear()
+    _fetch_comments.clear()
+    _score.clear()
+    _unique_dims.clear()
+    _filtered_summary_and_metrics.clear()
+    _markdown_report.clear()
+    _json_report.clear()
+    _excel_report.clear()
 
 
 # =============================================================================
@@ -932,78 +481,162 @@ def render_sidebar():
     }
 
 
-def render_dashboard_filters(
-    results: list[TaskCompliance],
-    completed_results: Optional[list[TaskCompliance]],
-    analyzer
-) -> dict:
+@st.cache_data(max_entries=16, show_spinner=False)
+def _unique_dims(
+    report_id: str,
+    _df: pd.DataFrame,
+) -> tuple[list[str], list[str], list[str]]:
+    """Compute sprint, assignee and status filter options in one cached call.
+
+    Keyed on the report (its generated_at), so re-fetched data gets fresh
+    options. Sprints and assignees come from every task, statuses from
+    active tasks only. Same results as the analyzer's get_unique_* helpers,
+    using pandas' hash-based unique().
+    """
+    sprints = _df["sprint"].dropna().astype(str).str.split(",").explode().str.strip()
+    sprints = sorted(sprints[sprints != ""].unique().tolist(), key=natural_sort_key)
+
+    assignees = _df["assignee"].dropna()
+    assignees = sorted(assignees[~assignees.isin(["", "Unassigned"])].unique().tolist())
+
+    progress = _df.loc[_df["active"], "progress"].dropna()
+    statuses = order_statuses(set(progress[progress != ""].unique().tolist()))
+
+    return sprints, assignees, statuses
+
+
+_FILTER_WIDGET_KEYS = (
+    "filter_sprint", "filter_assignees", "filter_statuses",
+    "completion_date_start", "completion_date_end",
+)
+
+
+def _seed_filter_widgets(defaults: dict, options: dict, remount: bool):
+    """Set filter widget values through their keys before the widgets exist.
+
+    The widgets' constructor arguments stay constant (they are part of the
+    element ID), so first-run defaults, the last applied values after a
+    remount (toggling Auto-apply moves them in or out of the form) and
+    options that disappeared after a re-fetch are all handled here.
+    """
+    applied = st.session_state["applied_filters"] or {}
+    for key, default in defaults.items():
+        if remount or key not in st.session_state:
+            value = applied.get(key, default)
+        else:
+            value = st.session_state[key]
+        allowed = options.get(key)
+        if allowed is not None:
+            if isinstance(value, list):
+                value = [v for v in value if v in allowed]
+            elif value not in allowed:
+                value = default
+        if key not in st.session_state or st.session_state[key] != value:
+            st.session_state[key] = value
+
+
+def render_dashboard_filters(tasks_df: pd.DataFrame, report_id: str) -> dict:
     """Render filter controls on the dashboard (horizontal layout)."""
     st.subheader("Filters")
 
-    col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+    col_filters, col_actions = st.columns([6, 1])
 
-    with col1:
-        # Sprint filter - combine active and completed tasks to get all sprints with data
-        all_tasks_for_sprints = results + (completed_results or [])
-        sprints = analyzer.get_unique_sprints(all_tasks_for_sprints)
-
-        # Default to the last sprint (most recent) if available
-        default_index = len(sprints) if sprints else 0
-
-        selected_sprint = st.selectbox(
-            "Sprint",
-            ["All"] + sprints,
-            index=default_index,
-            help="Filter by sprint (showing only sprints with data)",
-            key="filter_sprint"
-        )
+    # Sprint and assignee options come from active and completed tasks so every
+    # sprint with data is listed; statuses only from active tasks
+    sprints, assignees, statuses = _unique_dims(report_id, tasks_df)
 
-    with col2:
-        # Assignee filter - also from all tasks
-        assignees = analyzer.get_unique_assignees(all_tasks_for_sprints)
-        selected_assignees = st.multiselect(
-            "Assignees",
-            assignees,
-            default=[],
-            help="Filter by assignee (empty = all)",
-            key="filter_assignees"
+    with col_actions:
+        auto_apply = st.toggle(
+            "Auto-apply",
+            value=False,
+            help="Apply each filter change immediately instead of batching them",
+            key="filter_auto_apply"
         )
-
-    with col3:
-        # Status filter
-        statuses = analyzer.get_unique_statuses(results)
-        selected_statuses = st.multiselect(
-            "Status",
-            statuses,
-            default=[],
-            help="Filter by status (empty = all)",
-            key="filter_statuses"
-        )
-
-    with col4:
-        st.write("")  # Spacing
-        st.write("")  # Align with other fields
         if st.button("Refresh Data", type="secondary", use_container_width=True):
+            clear_report_cache()
             st.session_state["report_generated"] = False
-            st.rerun()
+            # Runs inside the dashboard fragment; the homepage needs a full rerun
+            st.rerun(scope="app")
+
+    sprint_options = ["All"] + sprints
+    remount = st.session_state["filters_auto_apply"] != auto_apply
+    st.session_state["filters_auto_apply"] = auto_apply
+    today = datetime.now().date()
+    _seed_filter_widgets(
+        {
+            # Default to the last sprint (most recent) if available
+            "filter_sprint": sprint_options[-1],
+            "filter_assignees": [],
+            "filter_statuses": [],
+            "completion_date_start": today - timedelta(days=14),
+            "completion_date_end": today,
+        },
+        {
+            "filter_sprint": sprint_options,
+            "filter_assignees": assignees,
+            "filter_statuses": statuses,
+        },
+        remount,
+    )
 
-    # Completion Analytics Date Range Filter
+    with col_filters:
+        # Inside a form, changes are batched and submitted together (one rerun)
+        container = st.container() if auto_apply else st.form("filters", border=False)
+        with container:
+            col1, col2, col3 = st.columns(3)
+
+            with col1:
+                selected_sprint = st.selectbox(
+                    "Sprint",
+                    sprint_options,
+                    help="Filter by sprint (showing only sprints with data)",
+                    key="filter_sprint"
+                )
+
+            with col2:
+                # Assignee filter - also from all tasks
+                selected_assignees = st.multiselect(
+                    "Assignees",
+                    assignees,
+                    help="Filter by assignee (empty = all)",
+                    key="filter_assignees"
+                )
+
+            with col3:
+                # Status filter
+                selected_statuses = st.multiselect(
+                    "Status",
+                    statuses,
+                    help="Filter by status (empty = all)",
+                    key="filter_statuses"
+                )
+
+            if not auto_apply:
+                st.form_submit_button("Apply filters", type="primary")
+
+    # Completion Analytics Date Range Filter (batched like the filters above,
+    # so picking both ends is one rerun rather than two)
     st.subheader("Completion Date Range")
-    col_start, col_end = st.columns(2)
-    with col_start:
-        completion_start = st.date_input(
-            "From",
-            value=datetime.now().date() - timedelta(days=14),
-            help="Start date for completion analytics",
-            key="completion_date_start"
-        )
-    with col_end:
-        completion_end = st.date_input(
-            "To",
-            value=datetime.now().date(),
-            help="End date for completion analytics",
-            key="completion_date_end"
-        )
+    container = st.container() if auto_apply else st.form("completion_range", border=False)
+    with container:
+        col_start, col_end = st.columns(2)
+        with col_start:
+            completion_start = st.date_input(
+                "From",
+                help="Start date for completion analytics",
+                key="completion_date_start"
+            )
+        with col_end:
+            completion_end = st.date_input(
+                "To",
+                help="End date for completion analytics",
+                key="completion_date_end"
+            )
+
+        if not auto_apply:
+            st.form_submit_button("Apply date range", type="primary")
+
+    st.session_state["applied_filters"] = {key: st.session_state[key] for key in _FILTER_WIDGET_KEYS}
 
     # Validate date range
     if completion_start > completion_end:
@@ -1023,51 +656,80 @@ def render_dashboard_filters(
 # Metric Cards
 # =============================================================================
 
-def render_metric_cards(summary: ReportSummary, metrics: dict):
-    """Render summary metric cards with neumorphic design."""
-    col1, col2, col3, col4 = st.columns(4)
+# Compliance rate (%) at or above which the dashboard counts as healthy
+COMPLIANCE_TARGET = 80
 
-    with col1:
-        compliance_class = "nm-card--success" if summary.compliance_rate >= 80 else "nm-card--warning"
-        st.markdown(f"""
-        <div class="nm-card {compliance_class}">
-            <div class="nm-card-value">{summary.compliance_rate:.0f}%</div>
-            <div class="nm-card-label">Compliance Rate</div>
-        </div>
-        """, unsafe_allow_html=True)
+_ALERT_TMPL = '<div class="nm-alert nm-alert--{kind}"><h3>{title}</h3><p>{text}</p></div>'.format
 
-    with col2:
-        st.markdown(f"""
-        <div class="nm-card">
-            <div class="nm-card-value">{summary.total_tasks}</div>
-            <div class="nm-card-label">Total Tasks</div>
-        </div>
-        """, unsafe_allow_html=True)
+# Static banners, formatted once at import
+_RED_ALERT_HTML = _ALERT_TMPL(
+    kind="error",
+    title="🔴 Critical - Review/QA Tasks Need Attention",
+    text="These tasks are in final stages but have issues that may block release",
+)
+_AMBER_ALERT_HTML = _ALERT_TMPL(
+    kind="warning",
+    title="⚠️ Action Required - Tasks Need Attention",
+    text="These tasks in To Do/In Progress have missing fields or rule violations",
+)
 
-    with col3:
-        st.markdown(f"""
-        <div class="nm-card nm-card--info">
-            <div class="nm-card-value">{metrics.get('total_points', 0):.0f}</div>
-            <div class="nm-card-label">Story Points</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col4:
-        updates_class = "nm-card--warning" if summary.tasks_missing_updates > 0 else "nm-card--success"
-        st.markdown(f"""
-        <div class="nm-card {updates_class}">
-            <div class="nm-card-value">{summary.tasks_missing_updates}</div>
-            <div class="nm-card-label">Missing Updates</div>
-        </div>
-        """, unsafe_allow_html=True)
+
+@functools.lru_cache(maxsize=256)
+def _render_alert(kind: str, title: str, text: str) -> str:
+    """Alert banner markup; kind is "error" or "warning"."""
+    return _ALERT_TMPL(kind=kind, title=title, text=text)
+
+
+def render_metric_cards(summary: ReportSummary, metrics: dict):
+    """Render summary metric cards as native st.metric elements (no markdown parse)."""
+    rate = summary.compliance_rate
+    missing = summary.tasks_missing_updates
+    missing_pct = (missing / summary.total_tasks * 100) if summary.total_tasks > 0 else 0
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric(
+        "Compliance Rate", f"{rate:.0f}%",
+        delta=f"{rate - COMPLIANCE_TARGET:+.0f}% vs {COMPLIANCE_TARGET}% target",
+    )
+    col2.metric("Total Tasks", summary.total_tasks)
+    col3.metric("Story Points", f"{metrics.get('total_points', 0):.0f}")
+    col4.metric(
+        "Missing Updates", missing,
+        delta=f"{missing_pct:.1f}%", delta_color="off" if missing == 0 else "inverse",
+    )
 
 
 # =============================================================================
 # Asana Task Viewer (Modal Dialog)
 # =============================================================================
 
+TASK_DETAILS_TTL_SECONDS = 120
+TASK_COMMENTS_TTL_SECONDS = 60
+TASK_DETAIL_FIELDS = (
+    "name,notes,assignee.name,due_on,completed,created_at,modified_at,"
+    "custom_fields,custom_fields.name,custom_fields.display_value,permalink_url"
+)
+
+
+@st.cache_data(ttl=TASK_DETAILS_TTL_SECONDS, show_spinner=False)
+def _fetch_task_details(token_hash: str, task_gid: str, _client) -> dict:
+    """Fetch one task for the viewer; repeat opens within the TTL skip the API.
+
+    Keyed on the token hash too, so one user's fetch is never served to
+    another token that may not be able to see the task.
+    """
+    task_details = _client.tasks_api.get_task(task_gid, opts={"opt_fields": TASK_DETAIL_FIELDS})
+    return task_details.to_dict() if hasattr(task_details, 'to_dict') else dict(task_details)
+
+
+@st.cache_data(ttl=TASK_COMMENTS_TTL_SECONDS, show_spinner=False)
+def _fetch_task_comments(token_hash: str, task_gid: str, _client) -> list[dict]:
+    """Fetch the latest comments for the viewer (short TTL)."""
+    return _client.get_task_comments(task_gid, limit=5)
+
+
 @st.dialog("Task Details", width="large")
-def show_task_dialog(task_gid: str, task_url: str, task_name: str, reporter):
+def show_task_dialog(task_gid: str, task_url: str, task_name: str, reporter, token_hash: str):
     """Show task details in a modal dialog."""
     # Header with link to Asana
     col1, col2 = st.columns([4, 1])
@@ -1078,14 +740,17 @@ def show_task_dialog(task_gid: str, task_url: str, task_name: str, reporter):
 
     st.divider()
 
-    # Fetch full task details from API
+    # Fetch task details and comments concurrently (latency is max, not sum)
     try:
         with st.spinner("Loading task details..."):
-            task_details = reporter.client.tasks_api.get_task(
-                task_gid,
-                opts={"opt_fields": "name,notes,assignee.name,due_on,completed,created_at,modified_at,custom_fields,custom_fields.name,custom_fields.display_value,permalink_url"}
-            )
-            task = task_details.to_dict() if hasattr(task_details, 'to_dict') else dict(task_details)
+            ctx = get_script_run_ctx()
+            with ThreadPoolExecutor(
+                max_workers=2,
+                initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+            ) as executor:
+                task_future = executor.submit(_fetch_task_details, token_hash, task_gid, reporter.client)
+                comments_future = executor.submit(_fetch_task_comments, token_hash, task_gid, reporter.client)
+            task = task_future.result()
 
         # Display task details in columns
         col1, col2 = st.columns(2)
@@ -1124,7 +789,7 @@ def show_task_dialog(task_gid: str, task_url: str, task_name: str, reporter):
         st.divider()
         st.markdown("**Recent Comments:**")
         try:
-            comments = reporter.client.get_task_comments(task_gid, limit=5)
+            comments = comments_future.result()
             if comments:
                 for comment in comments[:5]:
                     author = comment.get('created_by', {}).get('name', 'Unknown')
@@ -1132,7 +797,7 @@ def show_task_dialog(task_gid: str, task_url: str, task_name: str, reporter):
                     date = comment.get('created_at', '')[:10] if comment.get('created_at') else ''
                     if text:
                         st.markdown(f"**{author}** ({date})")
-                        st.markdown(f"> {text[:500]}{'...' if len(text) > 500 else ''}")
+                        st.markdown(f"> {shorten(text, 500)}")
                         st.write("")
             else:
                 st.info("No comments yet")
@@ -1155,122 +820,320 @@ def open_task_viewer(task_gid: str, task_url: str, task_name: str):
 # Burndown Chart
 # =============================================================================
 
-def task_in_sprint(task: TaskCompliance, sprint: str) -> bool:
-    """Check if a task belongs to a sprint (handles comma-separated sprint values)."""
-    if not task.sprint:
-        return False
-    # Sprint field can be comma-separated like "Manali, London"
-    task_sprints = [s.strip() for s in task.sprint.split(",")]
-    return sprint in task_sprints
+class TaskIndex(NamedTuple):
+    """Inverted indexes over one task list: filter value -> task positions."""
+    sprint: dict[str, list[int]]
+    assignee: dict[Optional[str], list[int]]
+    status: dict[Optional[str], list[int]]
+
+
+def build_task_index(tasks: list[TaskCompliance]) -> TaskIndex:
+    """Index tasks by sprint, assignee and status in one pass (once per report)."""
+    by_sprint: dict[str, list[int]] = defaultdict(list)
+    by_assignee: dict[Optional[str], list[int]] = defaultdict(list)
+    by_status: dict[Optional[str], list[int]] = defaultdict(list)
+    for i, t in enumerate(tasks):
+        # Sprint field can be comma-separated like "Manali, London"; split at ingest
+        for s in t.sprints:
+            by_sprint[s].append(i)
+        by_assignee[t.assignee].append(i)
+        by_status[t.progress].append(i)
+    return TaskIndex(dict(by_sprint), dict(by_assignee), dict(by_status))
+
+
+def filter_positions(filters: dict, index: TaskIndex) -> Optional[list[int]]:
+    """Ascending positions of the tasks passing the sprint/assignee/status filters.
+
+    Intersects index positions instead of scanning per predicate, so the tasks
+    at these positions match ComplianceAnalyzer.filter_results (same order);
+    None means no filter is active (every task passes).
+    """
+    selected = []
+    sprint = filters.get("sprint")
+    if sprint and sprint != "All":
+        selected.append(set(index.sprint.get(sprint, ())))
+    for values, by_value in (
+        (filters.get("assignees"), index.assignee),
+        (filters.get("statuses"), index.status),
+    ):
+        if values:
+            selected.append({i for v in values for i in by_value.get(v, ())})
+    if not selected:
+        return None
+    return sorted(set.intersection(*selected))
 
 
-def render_burndown_chart(
-    results: list[TaskCompliance],
-    completed_results: Optional[list[TaskCompliance]] = None,
-    selected_sprint: Optional[str] = None
-):
-    """Render sprint burndown chart with actual progress line."""
-    if not PLOTLY_AVAILABLE:
-        st.warning("Plotly is required for charts. Install with: pip install plotly")
-        return
+def tasks_in_sprint(
+    tasks: list[TaskCompliance],
+    sprint: str,
+    index: Optional[TaskIndex] = None,
+) -> list[TaskCompliance]:
+    """Tasks belonging to a sprint, via the index when one was built for ``tasks``."""
+    if index is not None:
+        return [tasks[i] for i in index.sprint.get(sprint, ())]
+    return [t for t in tasks if sprint in t.sprints]
+
+
+def _apply_task_filters(
+    tasks: list[TaskCompliance],
+    filters: dict,
+    index: Optional[TaskIndex] = None,
+) -> list[TaskCompliance]:
+    """Apply the dashboard's sprint/assignee/status filters via the task list's index."""
+    positions = filter_positions(filters, index if index is not None else build_task_index(tasks))
+    return tasks if positions is None else [tasks[i] for i in positions]
+
+
+# Neumorphism color palette for charts
+_NM_PALETTE = MappingProxyType({
+    "primary": "#6B7FD7",       # Muted blue-purple
+    "success": "#5B9A8B",       # Sage green
+    "error": "#C9736D",         # Muted coral
+    "text_primary": "#2D3748",  # Dark slate
+    "bg": "#E4E8EC",            # Soft gray background
+})
+_NM_GRID = "rgba(163, 177, 198, 0.3)"
+_NM_GRID_FAINT = "rgba(163, 177, 198, 0.1)"  # Secondary-axis grid
+_NM_AXIS_LINE = "rgba(163, 177, 198, 0.5)"
+# One color per series (e.g. per assignee), cycled when there are more
+_NM_SERIES_COLORS = (
+    _NM_PALETTE["primary"], _NM_PALETTE["success"], _NM_PALETTE["error"], "#D4A574", "#5A9AA8",
+    "#9B7ED9", "#7DB87D", "#E88E8E", "#F0B86E", "#6EC8D7",
+    "#C97BAF", "#85BB65", "#E8A07A", "#7B9FD4", "#D49A6A",
+)
+
+# Layout shared by every burndown figure (the title is added per call)
+_BURNDOWN_LAYOUT_BASE = MappingProxyType(dict(
+    xaxis_title="Date",
+    yaxis_title="Story Points Remaining",
+    hovermode="x unified",
+    showlegend=True,
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    height=450,
+    margin=dict(t=80),
+    paper_bgcolor=_NM_PALETTE["bg"],
+    plot_bgcolor=_NM_PALETTE["bg"],
+    font=dict(color=_NM_PALETTE["text_primary"]),
+    xaxis=dict(gridcolor=_NM_GRID, linecolor=_NM_AXIS_LINE, tickcolor=_NM_AXIS_LINE),
+    yaxis=dict(gridcolor=_NM_GRID, linecolor=_NM_AXIS_LINE, tickcolor=_NM_AXIS_LINE),
+))
+
+# Layout shared by every points-by-assignee figure (title and height are per call)
+_ASSIGNEE_LAYOUT_BASE = MappingProxyType(dict(
+    barmode="stack",
+    showlegend=True,
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    paper_bgcolor=_NM_PALETTE["bg"],
+    plot_bgcolor=_NM_PALETTE["bg"],
+    margin=dict(t=60, b=40, l=120, r=20),
+    xaxis=dict(title="Story Points", gridcolor=_NM_GRID),
+    yaxis=dict(title="", autorange="reversed"),  # Highest at top
+))
+
+# Above this many points WebGL beats SVG (same threshold as Plotly Express)
+WEBGL_POINT_THRESHOLD = 1000
+
+
+def _scatter_trace(go, n_points: int, render_mode: str = "auto"):
+    """Pick go.Scatter or go.Scattergl following Plotly Express render_mode semantics."""
+    if render_mode == "webgl" or (render_mode == "auto" and n_points >= WEBGL_POINT_THRESHOLD):
+        return go.Scattergl
+    return go.Scatter
+
+
+def _session_figure(state_key: str, fig_dict: dict):
+    """Figure held in session state, updated in place while its traces keep the same shape.
+
+    Rebuilding a go.Figure re-validates every trace and layout property; on the
+    common filter rerun only the series move, so the held figure's trace data,
+    title, height and annotations are swapped instead. A new figure is built
+    when the trace types/names differ (e.g. the Today marker appears).
+    """
+    new_traces = fig_dict["data"]
+    fig = st.session_state.get(state_key)
+    if fig is None or [(t.type, t.name) for t in fig.data] != [(t["type"], t.get("name")) for t in new_traces]:
+        fig = _get_plotly().Figure(fig_dict)
+        st.session_state[state_key] = fig
+        return fig
+
+    layout = fig_dict["layout"]
+    with fig.batch_update():
+        for trace, new in zip(fig.data, new_traces):
+            trace.x = new.get("x")
+            trace.y = new.get("y")
+            if "text" in new:
+                trace.text = new["text"]
+        fig.layout.title.text = layout["title"]["text"]
+        fig.layout.height = layout.get("height")
+        fig.layout.annotations = layout.get("annotations", ())
+    return fig
+
+
+# Longer series are M4-downsampled (first/min/max/last per bin) before plotting
+BURNDOWN_MAX_POINTS = 200
+
+
+def _m4_indices(y: np.ndarray, n_bins: int) -> np.ndarray:
+    """Indices kept by M4 aggregation: first, min, max and last point of each bin."""
+    edges = np.linspace(0, len(y), n_bins + 1).astype(int)
+    keep = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        if stop <= start:
+            continue
+        chunk = y[start:stop]
+        keep += [start, start + int(np.argmin(chunk)), start + int(np.argmax(chunk)), stop - 1]
+    return np.unique(keep)
+
+
+def _downsample_series(x: list, y: list, max_points: int = BURNDOWN_MAX_POINTS) -> tuple[list, list]:
+    """Return (x, y) unchanged when short, else M4-downsampled to at most max_points."""
+    if len(y) <= max_points:
+        return x, y
+    idx = _m4_indices(np.asarray(y, dtype=float), max_points // 4)
+    return [x[i] for i in idx], [y[i] for i in idx]
+
+
+class ChartTask(NamedTuple):
+    """Hashable snapshot of the task fields the charts read (cache key material)."""
+    gid: str
+    assignee: str
+    progress: Optional[str]
+    story_points: Optional[str]
+    task_type: Optional[str]
+    due_on: Optional[str]
+    completed_at: Optional[str]
+    created_at: str
+
+
+class BurndownData(NamedTuple):
+    """Computed burndown series and totals."""
+    dates: list[str]
+    ideal_line: list[float]
+    actual_line: list[Optional[float]]
+    total_points: float
+    completed_points: float
+    remaining: float
+
+
+def _chart_tasks(tasks: list[TaskCompliance]) -> tuple[ChartTask, ...]:
+    """Project tasks onto ChartTask tuples for use as cache keys."""
+    return tuple(
+        ChartTask(t.gid, t.assignee, t.progress, t.story_points, t.task_type, t.due_on, t.completed_at, t.created_at)
+        for t in tasks
+    )
+
 
-    # Determine which sprint to show
+# Statuses counted as done for burndown and progress purposes
+BURNDOWN_DONE_STATUSES = ("Review", "QA", "Done")
+
+
+def _tasks_to_frame(tasks: tuple[ChartTask, ...]) -> pd.DataFrame:
+    """ChartTask tuples as a DataFrame with a numeric ``points`` column (invalid/missing -> 0)."""
+    df = pd.DataFrame.from_records(tasks, columns=ChartTask._fields)
+    df["points"] = pd.to_numeric(df["story_points"], errors="coerce").fillna(0.0)
+    return df
+
+
+class SprintStats(NamedTuple):
+    """Point totals for one sprint, shared by the progress bar, burndown and assignee chart."""
+    task_count: int
+    total_points: float
+    completed_points: float
+    completion_dates: dict[str, float]  # date -> points completed that day
+    first_date: Optional[str]  # earliest due/created date (None when no task has one)
+    last_date: Optional[str]
+    by_assignee: tuple[list[str], list[float], list[float], list[float]]
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _compute_sprint_stats(
+    sprint_tasks: tuple[ChartTask, ...],
+    completed_sprint_tasks: tuple[ChartTask, ...],
+) -> tuple:
+    """Aggregate the sprint's tasks in one pass (fields of SprintStats)."""
+    active = _tasks_to_frame(sprint_tasks)
+    completed = _tasks_to_frame(completed_sprint_tasks)
+
+    # Tasks in Review, QA, or Done are considered "completed" for burndown and
+    # progress purposes; tasks completed in Asana always are
+    done = active["progress"].isin(BURNDOWN_DONE_STATUSES)
+
+    total_points = float(active["points"].sum() + completed["points"].sum())
+    completed_points = float(active.loc[done, "points"].sum() + completed["points"].sum())
+
+    # Completion date per task: due_on approximates it for Done tasks in the
+    # active list; truly completed tasks use completed_at, falling back to due_on
+    done_dates = active["due_on"].fillna("").where(done, "")
+    completed_dates = completed["completed_at"].fillna("").str.slice(0, 10)
+    completed_dates = completed_dates.where(completed_dates != "", completed["due_on"].fillna(""))
+    events = pd.DataFrame({
+        "date": pd.concat([done_dates, completed_dates], ignore_index=True),
+        "points": pd.concat([active["points"], completed["points"]], ignore_index=True),
+    })
+    events = events[(events["points"] > 0) & (events["date"] != "")]
+    completion_dates = events.groupby("date")["points"].sum().to_dict()
+
+    # Date range from all tasks (due dates and creation dates)
+    all_dates = pd.to_datetime(
+        pd.concat([
+            active["due_on"], active["created_at"].str.slice(0, 10),
+            completed["due_on"], completed["created_at"].str.slice(0, 10),
+        ]),
+        format="%Y-%m-%d",
+        errors="coerce",
+        cache=True,
+    ).dropna()
+    first_date = last_date = None
+    if not all_dates.empty:
+        first_date = all_dates.min().strftime("%Y-%m-%d")
+        last_date = all_dates.max().strftime("%Y-%m-%d")
+
+    return (
+        len(active) + len(completed),
+        total_points,
+        completed_points,
+        completion_dates,
+        first_date,
+        last_date,
+        _points_by_assignee(active, completed),
+    )
+
+
+def sprint_stats(
+    results: list[TaskCompliance],
+    completed_results: Optional[list[TaskCompliance]],
+    selected_sprint: Optional[str],
+    completed_task_index: Optional[TaskIndex] = None,
+) -> SprintStats:
+    """Filter to the selected sprint (everything when None) and aggregate it once per rerun."""
     if selected_sprint:
-        sprint = selected_sprint
         # Filter tasks that contain this sprint (handles comma-separated values)
-        sprint_tasks = [t for t in results if task_in_sprint(t, sprint)]
-        completed_sprint_tasks = [t for t in (completed_results or []) if task_in_sprint(t, sprint)]
+        sprint_tasks = tasks_in_sprint(results, selected_sprint)
+        completed_sprint_tasks = tasks_in_sprint(completed_results or [], selected_sprint, completed_task_index)
     else:
-        sprint = "All Sprints"
         sprint_tasks = results
         completed_sprint_tasks = completed_results or []
+    return SprintStats(*_compute_sprint_stats(_chart_tasks(sprint_tasks), _chart_tasks(completed_sprint_tasks)))
 
-    if not sprint_tasks and not completed_sprint_tasks:
-        st.info("No tasks found for burndown chart")
-        return
-
-    # Separate tasks by completion status
-    # Tasks in Review, QA, or Done are considered "completed" for burndown purposes
-    completed_statuses = ("Review", "QA", "Done")
-    done_tasks = [t for t in sprint_tasks if t.progress in completed_statuses]
-    active_tasks = [t for t in sprint_tasks if t.progress not in completed_statuses]
 
-    # Calculate total points (all tasks in sprint)
-    total_points = 0
-    completed_points = 0
-    completion_dates = {}  # date -> points completed that day
+@st.cache_data(max_entries=32, show_spinner=False)
+def _compute_burndown(stats: SprintStats, today_str: str) -> tuple:
+    """Compute burndown series from the sprint stats (fields of BurndownData).
 
-    # Process active (not done) tasks
-    for task in active_tasks:
-        try:
-            points = float(task.story_points) if task.story_points else 0
-        except (ValueError, TypeError):
-            points = 0
-        total_points += points
-
-    # Process "Done" tasks from incomplete list
-    for task in done_tasks:
-        try:
-            points = float(task.story_points) if task.story_points else 0
-        except (ValueError, TypeError):
-            points = 0
-        total_points += points
-        completed_points += points
-
-        # Use due_on as completion date approximation for Done tasks
-        if points > 0 and task.due_on:
-            completion_date = task.due_on
-            if completion_date not in completion_dates:
-                completion_dates[completion_date] = 0
-            completion_dates[completion_date] += points
-
-    # Process truly completed tasks from Asana
-    for task in completed_sprint_tasks:
-        try:
-            points = float(task.story_points) if task.story_points else 0
-        except (ValueError, TypeError):
-            points = 0
-        total_points += points
-        completed_points += points
-
-        # Use completed_at for actual completion date
-        if points > 0 and task.completed_at:
-            completion_date = task.completed_at[:10]  # YYYY-MM-DD
-            if completion_date not in completion_dates:
-                completion_dates[completion_date] = 0
-            completion_dates[completion_date] += points
-        elif points > 0 and task.due_on:
-            # Fallback to due_on if no completed_at
-            completion_date = task.due_on
-            if completion_date not in completion_dates:
-                completion_dates[completion_date] = 0
-            completion_dates[completion_date] += points
+    Returns empty series when there are no points or no dates to plot.
+    """
+    total_points = stats.total_points
+    completed_points = stats.completed_points
 
     if total_points == 0:
-        st.info("No story points found for this sprint")
-        return
-
-    # Get date range from all tasks
-    all_dates = []
-    for t in sprint_tasks + completed_sprint_tasks:
-        if t.due_on:
-            try:
-                all_dates.append(datetime.strptime(t.due_on, "%Y-%m-%d"))
-            except ValueError:
-                pass
-        if t.created_at:
-            try:
-                all_dates.append(datetime.strptime(t.created_at[:10], "%Y-%m-%d"))
-            except ValueError:
-                pass
+        return [], [], [], 0, 0, 0
 
-    if not all_dates:
-        st.warning("No dates found. Cannot generate burndown chart.")
-        return
+    if stats.first_date is None:
+        return [], [], [], total_points, completed_points, total_points
 
-    sprint_start = min(all_dates)
-    sprint_end = max(all_dates)
-    today = datetime.now()
+    sprint_start = pd.Timestamp(stats.first_date)
+    sprint_end = pd.Timestamp(stats.last_date)
+    today = pd.Timestamp(today_str)
 
     # Ensure reasonable date range
     if (sprint_end - sprint_start).days < 7:
@@ -1280,83 +1143,76 @@ def render_burndown_chart(
     if today > sprint_end:
         sprint_end = today
 
-    sprint_days = (sprint_end - sprint_start).days + 1
-    if sprint_days <= 0:
-        sprint_days = 14
-
     # Generate date range
-    dates = []
-    ideal_line = []
-    actual_line = []
+    idx = pd.date_range(sprint_start, sprint_end, freq="D")
+    dates = idx.strftime("%Y-%m-%d").tolist()
+    sprint_days = len(idx)
 
-    daily_decrement = total_points / sprint_days
-    remaining = total_points
+    # Ideal burndown
+    ideal_line = np.maximum(0, total_points - np.arange(sprint_days) * (total_points / sprint_days)).tolist()
 
-    current_date = sprint_start
-    day_num = 0
+    # Actual burndown - subtract completed points up to each date (completions
+    # outside the range are ignored)
+    daily_completed = pd.Series(stats.completion_dates, dtype=float).reindex(dates, fill_value=0.0).to_numpy()
+    remaining_by_day = total_points - np.cumsum(daily_completed)
+    remaining = float(remaining_by_day[-1])
 
-    while current_date <= sprint_end:
-        date_str = current_date.strftime("%Y-%m-%d")
-        dates.append(date_str)
+    # Only show actual line up to today
+    n_visible = int((idx <= today).sum())
+    actual_line = np.maximum(0, remaining_by_day[:n_visible]).tolist() + [None] * (sprint_days - n_visible)
 
-        # Ideal burndown
-        ideal_remaining = max(0, total_points - (daily_decrement * day_num))
-        ideal_line.append(ideal_remaining)
+    return dates, ideal_line, actual_line, total_points, completed_points, remaining
 
-        # Actual burndown - subtract completed points up to this date
-        if date_str in completion_dates:
-            remaining -= completion_dates[date_str]
 
-        # Only show actual line up to today
-        if current_date <= today:
-            actual_line.append(max(0, remaining))
-        else:
-            actual_line.append(None)
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_burndown_figure(data: BurndownData, sprint: str, today_str: str, render_mode: str) -> dict:
+    """Build the burndown Plotly figure and return it as a dict (cheap to cache and rebuild)."""
+    dates, ideal_line, actual_line, total_points, completed_points, remaining = data
 
-        current_date += timedelta(days=1)
-        day_num += 1
+    # Actual line is None past today; plot only the known prefix, then
+    # downsample both series so long sprints keep a flat payload
+    n_actual = sum(v is not None for v in actual_line)
+    ideal_x, ideal_y = _downsample_series(dates, ideal_line)
+    actual_x, actual_y = _downsample_series(dates[:n_actual], actual_line[:n_actual])
 
     # Create chart
+    go = _get_plotly()
+    # Render mode follows the raw series length; the downsampled one is capped
+    # at BURNDOWN_MAX_POINTS and would never reach WEBGL_POINT_THRESHOLD
+    Scatter = _scatter_trace(go, len(dates), render_mode)
     fig = go.Figure()
 
-    # Neumorphism color palette for charts
-    nm_primary = '#6B7FD7'      # Muted blue-purple
-    nm_success = '#5B9A8B'      # Sage green
-    nm_error = '#C9736D'        # Muted coral
-    nm_text_primary = '#2D3748' # Dark slate
-    nm_bg = '#E4E8EC'           # Soft gray background
-
     # Ideal burndown line
-    fig.add_trace(go.Scatter(
-        x=dates,
-        y=ideal_line,
+    fig.add_trace(Scatter(
+        x=ideal_x,
+        y=ideal_y,
         mode='lines',
         name='Ideal Burndown',
-        line=dict(color=nm_primary, dash='dash', width=2)
+        line=dict(color=_NM_PALETTE["primary"], dash='dash', width=2)
     ))
 
     # Actual burndown line
-    fig.add_trace(go.Scatter(
-        x=dates,
-        y=actual_line,
+    fig.add_trace(Scatter(
+        x=actual_x,
+        y=actual_y,
         mode='lines+markers',
         name='Actual Burndown',
-        line=dict(color=nm_success, width=3),
+        line=dict(color=_NM_PALETTE["success"], width=3),
         marker=dict(size=6),
         connectgaps=False
     ))
 
-    # Current state marker
-    today_str = today.strftime("%Y-%m-%d")
-    if today_str in dates:
-        idx = dates.index(today_str)
+    # Current state marker (dates are a contiguous daily range, so the index
+    # is the day offset from the first date)
+    idx = (datetime.strptime(today_str, "%Y-%m-%d") - datetime.strptime(dates[0], "%Y-%m-%d")).days
+    if 0 <= idx < len(dates):
         current_remaining = actual_line[idx] if actual_line[idx] is not None else remaining
         fig.add_trace(go.Scatter(
             x=[today_str],
             y=[current_remaining],
             mode='markers',
             name='Today',
-            marker=dict(color=nm_error, size=14, symbol='diamond'),
+            marker=dict(color=_NM_PALETTE["error"], size=14, symbol='diamond'),
             showlegend=True
         ))
 
@@ -1367,59 +1223,78 @@ def render_burndown_chart(
         xref="paper", yref="paper",
         text=f"Completed: {completed_points:.0f} / {total_points:.0f} pts ({pct_complete:.0f}%)",
         showarrow=False,
-        font=dict(size=14, color=nm_success),
+        font=dict(size=14, color=_NM_PALETTE["success"]),
         bgcolor="rgba(228,232,236,0.95)",
         borderpad=6
     )
 
     fig.update_layout(
+        **_BURNDOWN_LAYOUT_BASE,
         title=dict(
             text=f"Sprint Burndown: {sprint}",
-            font=dict(size=20, color=nm_text_primary)
-        ),
-        xaxis_title="Date",
-        yaxis_title="Story Points Remaining",
-        hovermode="x unified",
-        showlegend=True,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        height=450,
-        margin=dict(t=80),
-        paper_bgcolor=nm_bg,
-        plot_bgcolor=nm_bg,
-        font=dict(color=nm_text_primary),
-        xaxis=dict(
-            gridcolor='rgba(163, 177, 198, 0.3)',
-            linecolor='rgba(163, 177, 198, 0.5)',
-            tickcolor='rgba(163, 177, 198, 0.5)',
-        ),
-        yaxis=dict(
-            gridcolor='rgba(163, 177, 198, 0.3)',
-            linecolor='rgba(163, 177, 198, 0.5)',
-            tickcolor='rgba(163, 177, 198, 0.5)',
+            font=dict(size=20, color=_NM_PALETTE["text_primary"])
         ),
     )
 
-    st.plotly_chart(fig, use_container_width=True, key="burndown_main")
+    return fig.to_dict()
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_burndown_csv(dates: list[str], ideal_line: list[float], actual_line: list[Optional[float]]) -> str:
+    """Burndown series as CSV for the download button."""
+    return pd.DataFrame({
+        "Date": dates,
+        "Ideal Remaining": [round(p, 1) for p in ideal_line],
+        "Actual Remaining": [round(p, 1) if p is not None else "" for p in actual_line],
+    }).to_csv(index=False)
+
+
+def render_burndown_chart(
+    stats: SprintStats,
+    selected_sprint: Optional[str] = None,
+    render_mode: str = "auto",
+):
+    """Render sprint burndown chart with actual progress line.
+
+    render_mode is "auto", "svg" or "webgl", as in Plotly Express.
+    """
+    if not PLOTLY_AVAILABLE:
+        st.warning("Plotly is required for charts. Install with: pip install plotly")
+        return
+
+    sprint = selected_sprint or "All Sprints"
+
+    if not stats.task_count:
+        st.info("No tasks found for burndown chart")
+        return
+
+    today_str = datetime.now().strftime("%Y-%m-%d")
+    data = BurndownData(*_compute_burndown(stats, today_str))
+
+    if data.total_points == 0:
+        st.info("No story points found for this sprint")
+        return
+
+    if not data.dates:
+        st.warning("No dates found. Cannot generate burndown chart.")
+        return
+
+    fig = _session_figure("_burndown_fig", _build_burndown_figure(data, sprint, today_str, render_mode))
+    st.plotly_chart(
+        fig,
+        use_container_width=True,
+        key="burndown_main",
+        config={"staticPlot": False, "responsive": True},
+    )
 
     # Download burndown data
     col1, col2, col3 = st.columns([2, 1, 2])
     with col2:
-        df_download = pd.DataFrame({
-            "Date": dates,
-            "Ideal Remaining": [round(p, 1) for p in ideal_line],
-            "Actual Remaining": [round(p, 1) if p is not None else "" for p in actual_line],
-        })
-
-        buffer = io.BytesIO()
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-            df_download.to_excel(writer, index=False, sheet_name='Burndown')
-        buffer.seek(0)
-
         st.download_button(
             label="Download Burndown Data",
-            data=buffer,
-            file_name=f"burndown_{sprint.replace(' ', '_')}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            data=_build_burndown_csv(data.dates, data.ideal_line, data.actual_line),
+            file_name=f"burndown_{sprint.replace(' ', '_')}.csv",
+            mime="text/csv"
         )
 
 
@@ -1427,129 +1302,112 @@ def render_burndown_chart(
 # Quick Wins - Sprint Progress Bar
 # =============================================================================
 
-def render_sprint_progress_bar(
-    results: list[TaskCompliance],
-    completed_results: Optional[list[TaskCompliance]] = None,
-    selected_sprint: Optional[str] = None
-):
-    """Render beautiful neumorphic sprint progress bar with accurate completion data."""
-    # Filter by sprint if selected
-    if selected_sprint:
-        sprint_tasks = [t for t in results if task_in_sprint(t, selected_sprint)]
-        completed_sprint_tasks = [t for t in (completed_results or []) if task_in_sprint(t, selected_sprint)]
-    else:
-        sprint_tasks = results
-        completed_sprint_tasks = completed_results or []
-
-    # Calculate total and completed points (same logic as burndown)
-    # Tasks in Review, QA, or Done are considered "completed" for progress tracking
-    completed_statuses = ("Review", "QA", "Done")
-    total_points = 0
-    completed_points = 0
-
-    # Active tasks
-    for task in sprint_tasks:
-        try:
-            points = float(task.story_points) if task.story_points else 0
-        except (ValueError, TypeError):
-            points = 0
-        total_points += points
-        # Count Review, QA, Done status tasks as completed
-        if task.progress in completed_statuses:
-            completed_points += points
-
-    # Completed tasks from Asana (truly completed)
-    for task in completed_sprint_tasks:
-        try:
-            points = float(task.story_points) if task.story_points else 0
-        except (ValueError, TypeError):
-            points = 0
-        total_points += points
-        completed_points += points
-
-    pct = (completed_points / total_points * 100) if total_points > 0 else 0
-
-    st.markdown(f"""
+_PROGRESS_TMPL = """
     <div class="nm-progress-container">
-        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 12px;">
-            <h3 style="margin: 0; color: var(--nm-text-primary);">Sprint Progress</h3>
-            <span style="font-size: 1.5rem; font-weight: 700; color: var(--nm-primary);">{pct:.0f}%</span>
+        <div class="nm-progress-header">
+            <h3>Sprint Progress</h3>
+            <span class="nm-progress-pct">{pct:.0f}%</span>
         </div>
         <div class="nm-progress-bar-outer">
             <div class="nm-progress-bar-inner" style="width: {pct}%;"></div>
-            <div class="nm-progress-text">{completed_points:.0f} / {total_points:.0f} pts</div>
+            <div class="nm-progress-text">{done:.0f} / {total:.0f} pts</div>
         </div>
         <div class="nm-progress-stats">
-            <span>Completed: {completed_points:.0f} pts</span>
-            <span>Remaining: {total_points - completed_points:.0f} pts</span>
+            <span>Completed: {done:.0f} pts</span>
+            <span>Remaining: {remaining:.0f} pts</span>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+"""
+
+
+@st.cache_data(show_spinner=False)
+def _progress_html(done: float, total: float, pct: float) -> str:
+    """Sprint progress bar markup (identical across most filter reruns)."""
+    return _PROGRESS_TMPL.format(done=done, total=total, pct=pct, remaining=total - done)
+
+
+def render_sprint_progress_bar(stats: SprintStats):
+    """Render beautiful neumorphic sprint progress bar with accurate completion data."""
+    total_points, completed_points = stats.total_points, stats.completed_points
+
+    pct = (completed_points / total_points * 100) if total_points > 0 else 0
+
+    st.markdown(_progress_html(completed_points, total_points, pct), unsafe_allow_html=True)
 
 
 # =============================================================================
 # Quick Wins - Overdue Tasks Alert
 # =============================================================================
 
-def render_overdue_alert_section(results: list[TaskCompliance]):
-    """Render red alert for overdue tasks."""
-    overdue_tasks = [t for t in results if getattr(t, 'is_overdue', False)]
+# Rows shown per alert section before "Show more"
+ALERT_TOP_N = 10
+
+
+def _visible_rows(tasks: list[TaskCompliance], key: str) -> list[TaskCompliance]:
+    """First ALERT_TOP_N tasks, or all of them once the section's show-more toggle is on."""
+    if st.session_state.get(f"show_all_{key}", False):
+        return tasks
+    return tasks[:ALERT_TOP_N]
 
+
+def _show_more_toggle(tasks: list[TaskCompliance], key: str):
+    """Toggle revealing the rows hidden by _visible_rows (rendered below the rows)."""
+    if len(tasks) > ALERT_TOP_N:
+        st.toggle(f"Show {len(tasks) - ALERT_TOP_N} more", key=f"show_all_{key}")
+
+
+def split_due_tasks(
+    results: list[TaskCompliance],
+) -> tuple[list[TaskCompliance], list[TaskCompliance]]:
+    """Bucket tasks into (overdue, due within 7 days and not Done) in a single pass."""
+    overdue_tasks, due_soon = [], []
+    for t in results:
+        if t.is_overdue:
+            overdue_tasks.append(t)
+        days = t.days_until_due
+        if days is not None and 0 <= days <= 7 and t.progress != "Done":
+            due_soon.append(t)
+    return overdue_tasks, due_soon
+
+
+def render_overdue_alert_section(overdue_tasks: list[TaskCompliance]):
+    """Render red alert for overdue tasks."""
     if not overdue_tasks:
         return
 
     # Sort by most overdue first (most negative days_until_due)
-    overdue_tasks.sort(key=lambda t: getattr(t, 'days_until_due', 0) or 0)
+    overdue_tasks.sort(key=lambda t: t.days_until_due or 0)
 
     total_overdue_points = sum(
-        float(t.story_points) if t.story_points else 0
+        t.points_or_zero
         for t in overdue_tasks
     )
 
-    st.markdown(f"""
-    <div class="nm-alert nm-alert--error">
-        <h3>Overdue Tasks ({len(overdue_tasks)})</h3>
-        <p>{total_overdue_points:.0f} story points are past due date</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Create header row
-    header_cols = st.columns([3, 1.5, 1.5, 1, 1, 1])
-    headers = ["Task Name", "Assignee", "Due Date", "Days Overdue", "Points", "Actions"]
-    for i, header in enumerate(headers):
-        header_cols[i].markdown(f"**{header}**")
-
-    # Create data rows (sorted by most overdue first)
-    for idx, task in enumerate(overdue_tasks):
-        row_cols = st.columns([3, 1.5, 1.5, 1, 1, 1])
-
-        # Task name (truncated)
-        task_name = task.name[:35] + "..." if len(task.name) > 35 else task.name
-        row_cols[0].write(task_name)
-
-        # Assignee
-        row_cols[1].write(task.assignee or "Unassigned")
-
-        # Due Date
-        row_cols[2].write(task.due_on or "-")
-
-        # Days Overdue
-        days_until = getattr(task, 'days_until_due', None)
-        days_overdue = abs(days_until) if days_until is not None and days_until < 0 else 0
-        row_cols[3].write(f"{days_overdue}d")
-
-        # Points
-        row_cols[4].write(task.story_points or "-")
-
-        # Action buttons
-        btn_col1, btn_col2 = row_cols[5].columns(2)
-        if btn_col1.button("👁", key=f"overdue_view_{idx}", help="View in app"):
-            st.session_state["selected_task_gid"] = task.gid
-            st.session_state["selected_task_url"] = task.url
-            st.session_state["selected_task_name"] = task.name
-            st.rerun()
-        btn_col2.link_button("🔗", task.url, help="Open in Asana")
+    st.markdown(_render_alert(
+        "error",
+        f"Overdue Tasks ({len(overdue_tasks)})",
+        f"{total_overdue_points:.0f} story points are past due date",
+    ), unsafe_allow_html=True)
+
+    # One dataframe (sorted by most overdue first, top N unless expanded);
+    # selecting a row opens the task viewer
+    visible = _visible_rows(overdue_tasks, "overdue")
+    records = [
+        {
+            "Task Name": t.name,
+            "Assignee": t.assignee or "Unassigned",
+            "Due Date": t.due_on or "-",
+            "Days Overdue": abs(t.days_until_due) if t.days_until_due is not None and t.days_until_due < 0 else 0,
+            "Points": t.story_points or "-",
+        }
+        for t in visible
+    ]
+    render_task_dataframe(visible, records, {
+        "Task Name": st.column_config.TextColumn("Task Name", width="large"),
+        "Days Overdue": st.column_config.NumberColumn("Days Overdue", format="%dd"),
+    }, "overdue")
 
+    _show_more_toggle(overdue_tasks, "overdue")
     st.markdown("---")
 
 
@@ -1557,74 +1415,45 @@ def render_overdue_alert_section(results: list[TaskCompliance]):
 # Quick Wins - Due This Week Alert
 # =============================================================================
 
-def render_due_this_week_section(results: list[TaskCompliance]):
-    """Render amber alert for tasks due within 7 days."""
-    due_soon = [
-        t for t in results
-        if getattr(t, 'days_until_due', None) is not None
-        and 0 <= t.days_until_due <= 7
-        and t.progress != "Done"
-    ]
+_DAYS_LEFT_LABELS = {0: "Today", 1: "Tomorrow"}
+
 
+def render_due_this_week_section(due_soon: list[TaskCompliance]):
+    """Render amber alert for tasks due within 7 days."""
     if not due_soon:
         return
 
     # Sort by due date ascending (soonest first)
-    due_soon.sort(key=lambda t: getattr(t, 'days_until_due', 999) or 999)
+    due_soon.sort(key=lambda t: t.days_until_due or 999)
 
     total_due_points = sum(
-        float(t.story_points) if t.story_points else 0
+        t.points_or_zero
         for t in due_soon
     )
 
-    st.markdown(f"""
-    <div class="nm-alert nm-alert--warning">
-        <h3>Due This Week ({len(due_soon)})</h3>
-        <p>{total_due_points:.0f} story points due in the next 7 days</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Create header row
-    header_cols = st.columns([3, 1.5, 1.5, 1, 1, 1])
-    headers = ["Task Name", "Assignee", "Due Date", "Days Left", "Points", "Actions"]
-    for i, header in enumerate(headers):
-        header_cols[i].markdown(f"**{header}**")
-
-    # Create data rows
-    for idx, task in enumerate(due_soon):
-        row_cols = st.columns([3, 1.5, 1.5, 1, 1, 1])
-
-        # Task name (truncated)
-        task_name = task.name[:35] + "..." if len(task.name) > 35 else task.name
-        row_cols[0].write(task_name)
-
-        # Assignee
-        row_cols[1].write(task.assignee or "Unassigned")
-
-        # Due Date
-        row_cols[2].write(task.due_on or "-")
-
-        # Days Left
-        days_left = getattr(task, 'days_until_due', None)
-        if days_left == 0:
-            row_cols[3].write("Today")
-        elif days_left == 1:
-            row_cols[3].write("Tomorrow")
-        else:
-            row_cols[3].write(f"{days_left}d")
-
-        # Points
-        row_cols[4].write(task.story_points or "-")
-
-        # Action buttons
-        btn_col1, btn_col2 = row_cols[5].columns(2)
-        if btn_col1.button("👁", key=f"due_soon_view_{idx}", help="View in app"):
-            st.session_state["selected_task_gid"] = task.gid
-            st.session_state["selected_task_url"] = task.url
-            st.session_state["selected_task_name"] = task.name
-            st.rerun()
-        btn_col2.link_button("🔗", task.url, help="Open in Asana")
+    st.markdown(_render_alert(
+        "warning",
+        f"Due This Week ({len(due_soon)})",
+        f"{total_due_points:.0f} story points due in the next 7 days",
+    ), unsafe_allow_html=True)
+
+    # One dataframe (top N unless expanded); selecting a row opens the task viewer
+    visible = _visible_rows(due_soon, "due_soon")
+    records = [
+        {
+            "Task Name": t.name,
+            "Assignee": t.assignee or "Unassigned",
+            "Due Date": t.due_on or "-",
+            "Days Left": _DAYS_LEFT_LABELS.get(t.days_until_due, f"{t.days_until_due}d"),
+            "Points": t.story_points or "-",
+        }
+        for t in visible
+    ]
+    render_task_dataframe(visible, records, {
+        "Task Name": st.column_config.TextColumn("Task Name", width="large"),
+    }, "due_soon")
 
+    _show_more_toggle(due_soon, "due_soon")
     st.markdown("---")
 
 
@@ -1632,10 +1461,10 @@ def render_due_this_week_section(results: list[TaskCompliance]):
 # Quick Wins - Points by Assignee Chart (Stacked Bar with Invalid Detection)
 # =============================================================================
 
-# Valid Fibonacci story points
-VALID_FIBONACCI_POINTS = (0, 1, 2, 3, 5, 8, 13)
+# Valid Fibonacci story points (sets: O(1) membership; 3.0 in {3} holds for floats)
+VALID_FIBONACCI_POINTS = frozenset({0, 1, 2, 3, 5, 8, 13})
 # Types that should NOT have story points
-TYPES_WITHOUT_POINTS = ("Epic", "Bug")
+TYPES_WITHOUT_POINTS = frozenset({"Epic", "Bug"})
 
 
 def is_invalid_story_points(task: TaskCompliance) -> bool:
@@ -1643,101 +1472,58 @@ def is_invalid_story_points(task: TaskCompliance) -> bool:
     if not task.story_points:
         return False
 
-    try:
-        points = float(task.story_points)
-    except (ValueError, TypeError):
+    points = task.points
+    if math.isnan(points):
         return True  # Non-numeric is invalid
 
     # Bug or Epic with story points
     if task.task_type in TYPES_WITHOUT_POINTS and points > 0:
-        return True
-
-    # Non-Fibonacci number
-    if points != int(points) or int(points) not in VALID_FIBONACCI_POINTS:
-        return True
-
-    return False
-
-
-def render_points_by_assignee_chart(
-    results: list[TaskCompliance],
-    completed_results: Optional[list[TaskCompliance]] = None,
-    selected_sprint: Optional[str] = None
-):
-    """Render stacked horizontal bar chart showing completed vs remaining vs invalid points per assignee."""
-    if not PLOTLY_AVAILABLE:
-        st.warning("Plotly is required for charts. Install with: pip install plotly")
-        return
-
-    # Filter by sprint if selected
-    if selected_sprint:
-        sprint_tasks = [t for t in results if task_in_sprint(t, selected_sprint)]
-        completed_sprint_tasks = [t for t in (completed_results or []) if task_in_sprint(t, selected_sprint)]
-    else:
-        sprint_tasks = results
-        completed_sprint_tasks = completed_results or []
+        return True
 
-    # Calculate points per assignee (completed vs remaining vs invalid)
-    assignee_completed = {}
-    assignee_remaining = {}
-    assignee_invalid = {}
+    # Non-Fibonacci number (fractional values are never members)
+    return points not in VALID_FIBONACCI_POINTS
 
-    def process_task(task, is_completed_task=False):
-        """Process a single task and categorize its points."""
-        try:
-            points = float(task.story_points) if task.story_points else 0
-        except (ValueError, TypeError):
-            points = 0
 
-        if points == 0:
-            return
+def _points_by_assignee(
+    active: pd.DataFrame,
+    completed: pd.DataFrame,
+) -> tuple[list[str], list[float], list[float], list[float]]:
+    """Completed/remaining/invalid points per assignee, sorted by total points."""
+    df = pd.concat([active.assign(is_completed=False), completed.assign(is_completed=True)], ignore_index=True)
 
-        assignee = task.assignee or "Unassigned"
+    # Only tasks carrying points count (non-numeric points parse to 0)
+    df = df[df["points"] != 0]
+    if df.empty:
+        return [], [], [], []
 
-        # Initialize assignee if not seen
-        if assignee not in assignee_completed:
-            assignee_completed[assignee] = 0
-            assignee_remaining[assignee] = 0
-            assignee_invalid[assignee] = 0
-
-        # Check if invalid (Bug/Epic with points OR non-Fibonacci)
-        if is_invalid_story_points(task):
-            assignee_invalid[assignee] += points
-        elif is_completed_task or task.progress == "Done":
-            assignee_completed[assignee] += points
-        else:
-            assignee_remaining[assignee] += points
+    df["assignee"] = df["assignee"].fillna("").replace("", "Unassigned")
+    points = df["points"]
 
-    # Process active tasks
-    for task in sprint_tasks:
-        process_task(task, is_completed_task=False)
+    # Invalid: Bug/Epic with points, or not a Fibonacci number (fractions never match)
+    invalid = (df["task_type"].isin(TYPES_WITHOUT_POINTS) & (points > 0)) | ~points.isin(VALID_FIBONACCI_POINTS)
+    done = ~invalid & (df["is_completed"] | (df["progress"] == "Done"))
+    df["completed"] = points.where(done, 0.0)
+    df["remaining"] = points.where(~invalid & ~done, 0.0)
+    df["invalid"] = points.where(invalid, 0.0)
 
-    # Process completed tasks from Asana
-    for task in completed_sprint_tasks:
-        process_task(task, is_completed_task=True)
+    by_assignee = df.groupby("assignee")[["completed", "remaining", "invalid"]].sum()
+    by_assignee = by_assignee.loc[by_assignee.sum(axis=1).sort_values(ascending=False, kind="stable").index]
 
-    # Get all assignees and sort by total points
-    all_assignees = set(assignee_completed.keys()) | set(assignee_remaining.keys()) | set(assignee_invalid.keys())
-    if not all_assignees:
-        st.info("No story points data for assignees")
-        return
+    # Prepare data for chart
+    sorted_assignees = by_assignee.index.tolist()
+    completed_values = by_assignee["completed"].tolist()
+    remaining_values = by_assignee["remaining"].tolist()
+    invalid_values = by_assignee["invalid"].tolist()
 
-    assignee_totals = {
-        a: assignee_completed.get(a, 0) + assignee_remaining.get(a, 0) + assignee_invalid.get(a, 0)
-        for a in all_assignees
-    }
-    sorted_assignees = sorted(all_assignees, key=lambda a: assignee_totals[a], reverse=True)
+    return sorted_assignees, completed_values, remaining_values, invalid_values
 
-    # Prepare data for chart
-    completed_values = [assignee_completed.get(a, 0) for a in sorted_assignees]
-    remaining_values = [assignee_remaining.get(a, 0) for a in sorted_assignees]
-    invalid_values = [assignee_invalid.get(a, 0) for a in sorted_assignees]
 
-    # Neumorphic colors
-    nm_success = '#5B9A8B'  # Completed - green
-    nm_primary = '#6B7FD7'  # Remaining - blue
-    nm_error = '#C9736D'    # Invalid - red
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_assignee_figure(by_assignee: tuple[list[str], list[float], list[float], list[float]]) -> dict:
+    """Build the points-by-assignee Plotly figure and return it as a dict."""
+    sorted_assignees, completed_values, remaining_values, invalid_values = by_assignee
 
+    go = _get_plotly()
     fig = go.Figure()
 
     # Completed bar
@@ -1746,7 +1532,7 @@ def render_points_by_assignee_chart(
         x=completed_values,
         name='Completed',
         orientation='h',
-        marker=dict(color=nm_success),
+        marker=dict(color=_NM_PALETTE["success"]),
         text=[f'{v:.0f}' if v > 0 else '' for v in completed_values],
         textposition='inside',
         hovertemplate='%{y}<br>Completed: %{x:.0f} pts<extra></extra>'
@@ -1758,7 +1544,7 @@ def render_points_by_assignee_chart(
         x=remaining_values,
         name='Remaining',
         orientation='h',
-        marker=dict(color=nm_primary),
+        marker=dict(color=_NM_PALETTE["primary"]),
         text=[f'{v:.0f}' if v > 0 else '' for v in remaining_values],
         textposition='inside',
         hovertemplate='%{y}<br>Remaining: %{x:.0f} pts<extra></extra>'
@@ -1772,7 +1558,7 @@ def render_points_by_assignee_chart(
             x=invalid_values,
             name='Invalid',
             orientation='h',
-            marker=dict(color=nm_error, pattern=dict(shape="x", size=6)),
+            marker=dict(color=_NM_PALETTE["error"], pattern=dict(shape="x", size=6)),
             text=[f'{v:.0f}' if v > 0 else '' for v in invalid_values],
             textposition='inside',
             hovertemplate='%{y}<br>Invalid: %{x:.0f} pts<br>(Bug/Epic or non-Fibonacci)<extra></extra>'
@@ -1788,30 +1574,32 @@ def render_points_by_assignee_chart(
         title_text += f" | {total_invalid:.0f} invalid"
 
     fig.update_layout(
+        **_ASSIGNEE_LAYOUT_BASE,
         title=dict(
             text=title_text,
-            font=dict(size=16, color='#2D3748')
+            font=dict(size=16, color=_NM_PALETTE["text_primary"])
         ),
-        barmode='stack',
-        showlegend=True,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
         height=max(300, len(sorted_assignees) * 40 + 100),
-        paper_bgcolor='#E4E8EC',
-        plot_bgcolor='#E4E8EC',
-        margin=dict(t=60, b=40, l=120, r=20),
-        xaxis=dict(
-            title="Story Points",
-            gridcolor='rgba(163, 177, 198, 0.3)',
-        ),
-        yaxis=dict(
-            title="",
-            autorange="reversed",  # Highest at top
-        ),
     )
 
+    return fig.to_dict()
+
+
+def render_points_by_assignee_chart(stats: SprintStats):
+    """Render stacked horizontal bar chart showing completed vs remaining vs invalid points per assignee."""
+    if not PLOTLY_AVAILABLE:
+        st.warning("Plotly is required for charts. Install with: pip install plotly")
+        return
+
+    if not stats.by_assignee[0]:
+        st.info("No story points data for assignees")
+        return
+
+    fig = _session_figure("_assignee_fig", _build_assignee_figure(stats.by_assignee))
     st.plotly_chart(fig, use_container_width=True, key="points_by_assignee")
 
     # Show warning if there are invalid points
+    total_invalid = sum(stats.by_assignee[3])
     if total_invalid > 0:
         st.warning(f"**{total_invalid:.0f} invalid story points detected** - Bug/Epic with points or non-Fibonacci values")
 
@@ -1823,7 +1611,8 @@ def render_points_by_assignee_chart(
 def render_bug_count_chart(
     results: list[TaskCompliance],
     completed_results: Optional[list[TaskCompliance]] = None,
-    selected_sprint: Optional[str] = None
+    selected_sprint: Optional[str] = None,
+    completed_task_index: Optional[TaskIndex] = None,
 ) -> None:
     """Render horizontal bar chart showing bug count per assignee."""
     if not PLOTLY_AVAILABLE:
@@ -1836,8 +1625,8 @@ def render_bug_count_chart(
     # Filter completed results for the selected sprint
     if selected_sprint and selected_sprint != "All":
         completed_sprint_bugs = [
-            t for t in (completed_results or [])
-            if t.task_type == "Bug" and task_in_sprint(t, selected_sprint)
+            t for t in tasks_in_sprint(completed_results or [], selected_sprint, completed_task_index)
+            if t.task_type == "Bug"
         ]
     else:
         completed_sprint_bugs = [t for t in (completed_results or []) if t.task_type == "Bug"]
@@ -1880,10 +1669,7 @@ def render_bug_count_chart(
     active_values = [assignee_active_bugs.get(a, 0) for a in sorted_assignees]
     completed_values = [assignee_completed_bugs.get(a, 0) for a in sorted_assignees]
 
-    # Neumorphic colors
-    nm_error = '#C9736D'    # Active bugs - coral/red
-    nm_success = '#5B9A8B'  # Completed bugs - green
-
+    go = _get_plotly()
     fig = go.Figure()
 
     # Completed bugs bar (green)
@@ -1892,7 +1678,7 @@ def render_bug_count_chart(
         x=completed_values,
         name='Completed',
         orientation='h',
-        marker=dict(color=nm_success),
+        marker=dict(color=_NM_PALETTE["success"]),
         text=[f'{v}' if v > 0 else '' for v in completed_values],
         textposition='inside',
         hovertemplate='%{y}<br>Completed: %{x} bugs<extra></extra>'
@@ -1904,7 +1690,7 @@ def render_bug_count_chart(
         x=active_values,
         name='Active',
         orientation='h',
-        marker=dict(color=nm_error),
+        marker=dict(color=_NM_PALETTE["error"]),
         text=[f'{v}' if v > 0 else '' for v in active_values],
         textposition='inside',
         hovertemplate='%{y}<br>Active: %{x} bugs<extra></extra>'
@@ -1915,18 +1701,18 @@ def render_bug_count_chart(
     fig.update_layout(
         title=dict(
             text=title_text,
-            font=dict(size=16, color='#2D3748')
+            font=dict(size=16, color=_NM_PALETTE["text_primary"])
         ),
         barmode='stack',
         showlegend=True,
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
         height=max(300, len(sorted_assignees) * 40 + 100),
-        paper_bgcolor='#E4E8EC',
-        plot_bgcolor='#E4E8EC',
+        paper_bgcolor=_NM_PALETTE["bg"],
+        plot_bgcolor=_NM_PALETTE["bg"],
         margin=dict(t=60, b=40, l=120, r=20),
         xaxis=dict(
             title="Bug Count",
-            gridcolor='rgba(163, 177, 198, 0.3)',
+            gridcolor=_NM_GRID,
             dtick=1,  # Integer tick marks for counts
         ),
         yaxis=dict(
@@ -1938,6 +1724,12 @@ def render_bug_count_chart(
     st.plotly_chart(fig, use_container_width=True, key="bugs_by_assignee")
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_ymd(value: str) -> date:
+    """Parse a YYYY-MM-DD string to a date (memoized; tasks share few dates)."""
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
 # =============================================================================
 # Completion Analytics - Tasks Completed by Team
 # =============================================================================
@@ -1945,7 +1737,8 @@ def render_bug_count_chart(
 def render_team_completion_chart(
     completed_results: Optional[list[TaskCompliance]],
     filters: dict,
-    selected_sprint: Optional[str] = None
+    selected_sprint: Optional[str] = None,
+    completed_task_index: Optional[TaskIndex] = None,
 ) -> dict:
     """
     Render daily completion chart for the team.
@@ -1960,15 +1753,18 @@ def render_team_completion_chart(
     completion_end = filters.get("completion_end", datetime.now().date())
 
     # Filter completed tasks by sprint and date range
+    sprint_tasks = completed_results or []
+    if selected_sprint:
+        sprint_tasks = tasks_in_sprint(sprint_tasks, selected_sprint, completed_task_index)
     filtered_tasks = []
-    for task in (completed_results or []):
+    for task in sprint_tasks:
         # Skip if no completed_at date
         if not task.completed_at:
             continue
 
         # Parse completion date
         try:
-            completed_date = datetime.strptime(task.completed_at[:10], "%Y-%m-%d").date()
+            completed_date = _parse_ymd(task.completed_at[:10])
         except (ValueError, TypeError):
             continue
 
@@ -1976,10 +1772,6 @@ def render_team_completion_chart(
         if not (completion_start <= completed_date <= completion_end):
             continue
 
-        # Check sprint filter
-        if selected_sprint and not task_in_sprint(task, selected_sprint):
-            continue
-
         filtered_tasks.append(task)
 
     if not filtered_tasks:
@@ -1987,35 +1779,21 @@ def render_team_completion_chart(
         return {}
 
     # Group tasks by completion date
-    daily_completions = {}
-    daily_points = {}
+    daily_completions = defaultdict(list)
+    daily_points = defaultdict(float)
 
     for task in filtered_tasks:
         date_str = task.completed_at[:10]  # YYYY-MM-DD
-
-        if date_str not in daily_completions:
-            daily_completions[date_str] = []
-            daily_points[date_str] = 0
-
         daily_completions[date_str].append(task)
-        try:
-            points = float(task.story_points) if task.story_points else 0
-        except (ValueError, TypeError):
-            points = 0
-        daily_points[date_str] += points
+        daily_points[date_str] += task.points_or_zero
 
     # Sort dates
     sorted_dates = sorted(daily_completions.keys())
     task_counts = [len(daily_completions[d]) for d in sorted_dates]
     point_values = [daily_points[d] for d in sorted_dates]
 
-    # Neumorphic colors
-    nm_primary = '#6B7FD7'
-    nm_success = '#5B9A8B'
-    nm_text_primary = '#2D3748'
-    nm_bg = '#E4E8EC'
-
     # Create figure with secondary y-axis
+    go = _get_plotly()
     fig = go.Figure()
 
     # Task count bars
@@ -2023,7 +1801,7 @@ def render_team_completion_chart(
         x=sorted_dates,
         y=task_counts,
         name='Tasks Completed',
-        marker=dict(color=nm_primary),
+        marker=dict(color=_NM_PALETTE["primary"]),
         text=task_counts,
         textposition='auto',
         hovertemplate='%{x}<br>Tasks: %{y}<extra></extra>'
@@ -2035,7 +1813,7 @@ def render_team_completion_chart(
         y=point_values,
         mode='lines+markers',
         name='Story Points',
-        line=dict(color=nm_success, width=3),
+        line=dict(color=_NM_PALETTE["success"], width=3),
         marker=dict(size=8),
         yaxis='y2',
         hovertemplate='%{x}<br>Points: %{y:.0f}<extra></extra>'
@@ -2048,15 +1826,15 @@ def render_team_completion_chart(
     fig.update_layout(
         title=dict(
             text=f"Tasks Completed by Team ({total_tasks} tasks, {total_points:.0f} pts)",
-            font=dict(size=16, color=nm_text_primary)
+            font=dict(size=16, color=_NM_PALETTE["text_primary"])
         ),
         xaxis=dict(
             title="Date",
-            gridcolor='rgba(163, 177, 198, 0.3)',
+            gridcolor=_NM_GRID,
         ),
         yaxis=dict(
             title="Tasks Completed",
-            gridcolor='rgba(163, 177, 198, 0.3)',
+            gridcolor=_NM_GRID,
             rangemode='tozero',
         ),
         yaxis2=dict(
@@ -2064,19 +1842,19 @@ def render_team_completion_chart(
             overlaying='y',
             side='right',
             rangemode='tozero',
-            gridcolor='rgba(163, 177, 198, 0.1)',
+            gridcolor=_NM_GRID_FAINT,
         ),
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
         height=400,
-        paper_bgcolor=nm_bg,
-        plot_bgcolor=nm_bg,
+        paper_bgcolor=_NM_PALETTE["bg"],
+        plot_bgcolor=_NM_PALETTE["bg"],
         margin=dict(t=60, b=40, l=60, r=60),
         hovermode="x unified",
     )
 
     st.plotly_chart(fig, use_container_width=True, key="team_completion_chart")
 
-    return daily_completions
+    return dict(daily_completions)
 
 
 # =============================================================================
@@ -2087,7 +1865,8 @@ def render_individual_completion_chart(
     completed_results: Optional[list[TaskCompliance]],
     filters: dict,
     selected_sprint: Optional[str] = None,
-    team_data: Optional[dict] = None
+    team_data: Optional[dict] = None,
+    completed_task_index: Optional[TaskIndex] = None,
 ) -> None:
     """
     Render daily completion chart grouped by individual assignees.
@@ -2106,23 +1885,21 @@ def render_individual_completion_chart(
         completion_end = filters.get("completion_end", datetime.now().date())
 
         # Filter completed tasks by sprint and date range
-        daily_completions = {}
-        for task in (completed_results or []):
+        sprint_tasks = completed_results or []
+        if selected_sprint:
+            sprint_tasks = tasks_in_sprint(sprint_tasks, selected_sprint, completed_task_index)
+        daily_completions = defaultdict(list)
+        for task in sprint_tasks:
             if not task.completed_at:
                 continue
             try:
-                completed_date = datetime.strptime(task.completed_at[:10], "%Y-%m-%d").date()
+                completed_date = _parse_ymd(task.completed_at[:10])
             except (ValueError, TypeError):
                 continue
             if not (completion_start <= completed_date <= completion_end):
                 continue
-            if selected_sprint and not task_in_sprint(task, selected_sprint):
-                continue
 
-            date_str = task.completed_at[:10]
-            if date_str not in daily_completions:
-                daily_completions[date_str] = []
-            daily_completions[date_str].append(task)
+            daily_completions[task.completed_at[:10]].append(task)
 
     if not daily_completions:
         st.info("No completed tasks found in the selected date range")
@@ -2145,21 +1922,13 @@ def render_individual_completion_chart(
             assignee_date_counts[assignee][date_str] += 1
 
     # Neumorphic color palette for assignees
-    assignee_colors = [
-        '#6B7FD7', '#5B9A8B', '#C9736D', '#D4A574', '#5A9AA8',
-        '#9B7ED9', '#7DB87D', '#E88E8E', '#F0B86E', '#6EC8D7',
-        '#C97BAF', '#85BB65', '#E8A07A', '#7B9FD4', '#D49A6A',
-    ]
-
-    nm_text_primary = '#2D3748'
-    nm_bg = '#E4E8EC'
-
+    go = _get_plotly()
     fig = go.Figure()
 
     # Add stacked bars for each assignee
     for i, assignee in enumerate(sorted_assignees):
         counts = [assignee_date_counts[assignee][d] for d in sorted_dates]
-        color = assignee_colors[i % len(assignee_colors)]
+        color = _NM_SERIES_COLORS[i % len(_NM_SERIES_COLORS)]
 
         fig.add_trace(go.Bar(
             x=sorted_dates,
@@ -2181,16 +1950,16 @@ def render_individual_completion_chart(
     fig.update_layout(
         title=dict(
             text=title_text,
-            font=dict(size=16, color=nm_text_primary)
+            font=dict(size=16, color=_NM_PALETTE["text_primary"])
         ),
         barmode='stack',
         xaxis=dict(
             title="Date",
-            gridcolor='rgba(163, 177, 198, 0.3)',
+            gridcolor=_NM_GRID,
         ),
         yaxis=dict(
             title="Tasks Completed",
-            gridcolor='rgba(163, 177, 198, 0.3)',
+            gridcolor=_NM_GRID,
             rangemode='tozero',
         ),
         legend=dict(
@@ -2202,8 +1971,8 @@ def render_individual_completion_chart(
             font=dict(size=10)
         ),
         height=400,
-        paper_bgcolor=nm_bg,
-        plot_bgcolor=nm_bg,
+        paper_bgcolor=_NM_PALETTE["bg"],
+        plot_bgcolor=_NM_PALETTE["bg"],
         margin=dict(t=80, b=40, l=60, r=20),
         hovermode="x unified",
     )
@@ -2221,81 +1990,61 @@ def render_individual_completion_chart(
 # Quick Wins - Invalid Story Points Section
 # =============================================================================
 
-def get_invalid_reason(task: TaskCompliance) -> Optional[str]:
-    """Get the reason why a task has invalid story points."""
+# Kinds of invalid story points (first item of get_invalid_reason's result)
+INVALID_NON_NUMERIC, INVALID_BUG, INVALID_EPIC, INVALID_NON_FIBONACCI = range(4)
+_INVALID_TYPE_KIND = MappingProxyType({"Bug": INVALID_BUG, "Epic": INVALID_EPIC})
+
+
+def get_invalid_reason(task: TaskCompliance) -> Optional[tuple[int, str, float]]:
+    """Classify a task's invalid story points as (kind, reason, points), or None if valid."""
     if not task.story_points:
         return None
 
-    try:
-        points = float(task.story_points)
-    except (ValueError, TypeError):
-        return "Non-numeric value"
+    points = task.points
+    if math.isnan(points):
+        return INVALID_NON_NUMERIC, "Non-numeric value", 0.0
 
     # Bug or Epic with story points
     if task.task_type in TYPES_WITHOUT_POINTS and points > 0:
-        return f"{task.task_type} should not have points"
+        return _INVALID_TYPE_KIND[task.task_type], f"{task.task_type} should not have points", points
 
-    # Non-Fibonacci number
-    if points != int(points) or int(points) not in VALID_FIBONACCI_POINTS:
-        return f"Non-Fibonacci value ({task.story_points})"
+    # Non-Fibonacci number (fractional values are never members)
+    if points not in VALID_FIBONACCI_POINTS:
+        return INVALID_NON_FIBONACCI, f"Non-Fibonacci value ({task.story_points})", points
 
     return None
 
 
 def render_invalid_story_points_section(
     results: list[TaskCompliance],
-    completed_results: Optional[list[TaskCompliance]] = None,
-    filters: Optional[dict] = None
+    filtered_completed: list[TaskCompliance],
 ):
-    """Render section showing all tasks with invalid story points (including completed)."""
-    filters = filters or {}
-    selected_sprint = filters.get("sprint")
-    selected_assignees = filters.get("assignees")
-    selected_statuses = filters.get("statuses")
-
-    # DEBUG: Show what filters are being applied
-    st.caption(f"DEBUG - Filters: sprint={selected_sprint}, assignees={selected_assignees}, statuses={selected_statuses}")
-
-    # results is already filtered, just use it directly
-    filtered_active_tasks = results
-
-    # Apply all filters to completed_results
-    filtered_completed_tasks = completed_results or []
-    before_filter_count = len(filtered_completed_tasks)
-    if selected_sprint and selected_sprint != "All":
-        filtered_completed_tasks = [t for t in filtered_completed_tasks if task_in_sprint(t, selected_sprint)]
-    if selected_assignees and len(selected_assignees) > 0:
-        filtered_completed_tasks = [t for t in filtered_completed_tasks if t.assignee in selected_assignees]
-    if selected_statuses and len(selected_statuses) > 0:
-        filtered_completed_tasks = [t for t in filtered_completed_tasks if t.progress in selected_statuses]
-
-    st.caption(f"DEBUG - Completed tasks: {before_filter_count} -> {len(filtered_completed_tasks)} after filter")
+    """Render section showing all tasks with invalid story points (including completed).
 
-    # Combine all tasks and find invalid ones
-    all_tasks = filtered_active_tasks + filtered_completed_tasks
-    invalid_tasks = []
-
-    for task in all_tasks:
-        reason = get_invalid_reason(task)
-        if reason:
-            invalid_tasks.append((task, reason))
+    Both lists arrive already filtered by the dashboard filters.
+    """
+    # Find invalid tasks, counting kinds and points in the same pass
+    invalid_tasks = []  # (task, reason, points, is_completed)
+    kind_counts = Counter()
+    total_invalid_points = 0.0
+    for tasks, is_completed in ((results, False), (filtered_completed, True)):
+        for task in tasks:
+            invalid = get_invalid_reason(task)
+            if invalid:
+                kind, reason, points = invalid
+                invalid_tasks.append((task, reason, points, is_completed))
+                kind_counts[kind] += 1
+                total_invalid_points += points
 
     if not invalid_tasks:
         return
 
-    # Sort by assignee, then by points descending
-    invalid_tasks.sort(key=lambda x: (x[0].assignee or "ZZZ", -(float(x[0].story_points or 0))))
-
-    # Calculate total invalid points
-    total_invalid_points = sum(
-        float(t.story_points) if t.story_points else 0
-        for t, _ in invalid_tasks
-    )
+    # Sort by assignee (unassigned last; "\uffff" sorts after any name), then by points descending
+    invalid_tasks.sort(key=lambda x: (x[0].assignee or "\uffff", -x[2]))
 
-    # Group by reason type for summary
-    bugs_with_points = sum(1 for _, r in invalid_tasks if "Bug" in r)
-    epics_with_points = sum(1 for _, r in invalid_tasks if "Epic" in r)
-    non_fibonacci = sum(1 for _, r in invalid_tasks if "Fibonacci" in r)
+    bugs_with_points = kind_counts[INVALID_BUG]
+    epics_with_points = kind_counts[INVALID_EPIC]
+    non_fibonacci = kind_counts[INVALID_NON_FIBONACCI]
 
     # Build summary text
     summary_parts = []
@@ -2306,53 +2055,29 @@ def render_invalid_story_points_section(
     if non_fibonacci:
         summary_parts.append(f"{non_fibonacci} non-Fibonacci values")
 
-    st.markdown(f"""
-    <div class="nm-alert nm-alert--error">
-        <h3>Invalid Story Points ({len(invalid_tasks)} tasks)</h3>
-        <p>{total_invalid_points:.0f} points are invalid: {', '.join(summary_parts)}</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Create header row
-    header_cols = st.columns([2.5, 1.2, 0.8, 0.8, 2, 0.8, 0.8])
-    headers = ["Task Name", "Assignee", "Type", "Points", "Issue", "Status", "Actions"]
-    for i, header in enumerate(headers):
-        header_cols[i].markdown(f"**{header}**")
-
-    # Create data rows
-    for idx, (task, reason) in enumerate(invalid_tasks):
-        row_cols = st.columns([2.5, 1.2, 0.8, 0.8, 2, 0.8, 0.8])
-
-        # Task name (truncated)
-        task_name = task.name[:30] + "..." if len(task.name) > 30 else task.name
-        row_cols[0].write(task_name)
-
-        # Assignee
-        row_cols[1].write(task.assignee or "Unassigned")
-
-        # Type
-        row_cols[2].write(task.task_type or "-")
-
-        # Points
-        row_cols[3].write(task.story_points or "-")
-
-        # Issue reason (highlighted)
-        row_cols[4].markdown(f"**:red[{reason}]**")
-
-        # Status (show if completed)
-        status = task.progress or "Done"
-        if task in filtered_completed_tasks:
-            status = "Completed"
-        row_cols[5].write(status)
-
-        # Action buttons
-        btn_col1, btn_col2 = row_cols[6].columns(2)
-        if btn_col1.button("👁", key=f"invalid_view_{idx}", help="View in app"):
-            st.session_state["selected_task_gid"] = task.gid
-            st.session_state["selected_task_url"] = task.url
-            st.session_state["selected_task_name"] = task.name
-            st.rerun()
-        btn_col2.link_button("🔗", task.url, help="Open in Asana")
+    st.markdown(_render_alert(
+        "error",
+        f"Invalid Story Points ({len(invalid_tasks)} tasks)",
+        f"{total_invalid_points:.0f} points are invalid: {', '.join(summary_parts)}",
+    ), unsafe_allow_html=True)
+
+    # One dataframe; selecting a row opens the task viewer
+    row_tasks = [task for task, *_ in invalid_tasks]
+    records = [
+        {
+            "Task Name": task.name,
+            "Assignee": task.assignee or "Unassigned",
+            "Type": task.task_type or "-",
+            "Points": task.story_points or "-",
+            "Issue": reason,
+            "Status": "Completed" if is_completed else task.progress or "Done",
+        }
+        for task, reason, _, is_completed in invalid_tasks
+    ]
+    render_task_dataframe(row_tasks, records, {
+        "Task Name": st.column_config.TextColumn("Task Name", width="large"),
+        "Issue": st.column_config.TextColumn("Issue", width="medium"),
+    }, "invalid_story_points")
 
     st.markdown("---")
 
@@ -2361,158 +2086,106 @@ def render_invalid_story_points_section(
 # Alert Sections
 # =============================================================================
 
-def get_missing_fields(task: TaskCompliance) -> list[str]:
-    """Get list of missing mandatory fields for a task."""
-    missing = []
-    if task.missing_epic:
-        missing.append("Epic")
-    if task.missing_sprint:
-        missing.append("Sprint")
-    if task.missing_type:
-        missing.append("Type")
-    if task.missing_points:
-        missing.append("Story Points")
-    if task.invalid_points:
-        missing.append("Invalid Points")
-    if task.missing_severity:
-        missing.append("Severity")
-    if task.missing_due_date:
-        missing.append("Due Date")
-    if task.missing_description:
-        missing.append("Description/ACs")
-    return missing
+def get_missing_fields(task: TaskCompliance) -> tuple[str, ...]:
+    """Get missing mandatory fields for a task (computed once per task)."""
+    return task.missing_fields
 
 
 def get_all_issues(task: TaskCompliance) -> list[str]:
     """Get list of all compliance issues including rule violations."""
-    issues = get_missing_fields(task)
-    # Use getattr for backward compatibility with cached TaskCompliance objects
-    rule_violations = getattr(task, 'rule_violations', [])
-    if rule_violations:
-        issues.extend(rule_violations)
-    return issues
+    return [*task.missing_fields, *task.rule_violations]
 
 
-def render_red_alert_section(results: list[TaskCompliance]):
-    """Render red alert for Review/QA tasks with issues."""
-    # Filter: Review or QA with any compliance issue (including rule violations)
-    red_tasks = [
-        t for t in results
-        if t.progress in ("Review", "QA")
-        and (t.mandatory_count > 0 or t.missing_daily_update or getattr(t, 'rule_violations', []))
-    ]
+def _abbrev_issues(prefix: str, items, limit: int) -> Optional[str]:
+    """'Prefix: a, b...' showing the first ``limit`` items, or None when empty."""
+    if not items:
+        return None
+    return f"{prefix}: {', '.join(items[:limit])}" + ("..." if len(items) > limit else "")
 
-    if not red_tasks:
-        return  # Don't show section if no issues
 
-    st.markdown("""
-    <div class="nm-alert nm-alert--error">
-        <h3>🔴 Critical - Review/QA Tasks Need Attention</h3>
-        <p>These tasks are in final stages but have issues that may block release</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Create header row
-    header_cols = st.columns([3, 1.5, 1, 2, 1, 1])
-    headers = ["Task Name", "Assignee", "Status", "Issues", "Hours Since Update", "Actions"]
-    for i, header in enumerate(headers):
-        header_cols[i].markdown(f"**{header}**")
-
-    # Create data rows
-    for idx, task in enumerate(red_tasks):
-        row_cols = st.columns([3, 1.5, 1, 2, 1, 1])
-
-        # Task name (truncated)
-        task_name = task.name[:35] + "..." if len(task.name) > 35 else task.name
-        row_cols[0].write(task_name)
-
-        # Assignee
-        row_cols[1].write(task.assignee or "Unassigned")
-
-        # Status
-        row_cols[2].write(task.progress or "-")
-
-        # Issues
-        issues = []
-        if task.missing_daily_update:
-            issues.append("No daily update")
-        missing = get_missing_fields(task)
-        if missing:
-            issues.append(f"Missing: {', '.join(missing[:2])}" + ("..." if len(missing) > 2 else ""))
-        task_rule_violations = getattr(task, 'rule_violations', [])
-        if task_rule_violations:
-            issues.append(f"Rules: {', '.join(task_rule_violations[:1])}" + ("..." if len(task_rule_violations) > 1 else ""))
-        row_cols[3].write("; ".join(issues) if issues else "-")
-
-        # Hours since update
-        hours = "-"
-        if task.hours_since_update is not None:
-            hours = f"{task.hours_since_update:.0f}h"
-        row_cols[4].write(hours)
-
-        # Action buttons
-        btn_col1, btn_col2 = row_cols[5].columns(2)
-        if btn_col1.button("👁", key=f"red_view_{idx}", help="View in app"):
-            st.session_state["selected_task_gid"] = task.gid
-            st.session_state["selected_task_url"] = task.url
-            st.session_state["selected_task_name"] = task.name
-            st.rerun()
-        btn_col2.link_button("🔗",task.url, help="Open in Asana")
+def _red_alert_issues(task: TaskCompliance) -> str:
+    """Compact issue summary for a red alert row."""
+    issues = [
+        issue for issue in (
+            "No daily update" if task.missing_daily_update else None,
+            _abbrev_issues("Missing", task.missing_fields, 2),
+            _abbrev_issues("Rules", task.rule_violations, 1),
+        )
+        if issue
+    ]
+    return "; ".join(issues) or "-"
 
-    st.markdown("---")
 
+# Red: Review/QA with any compliance issue (including rule violations)
+# Amber: To Do/In Progress with missing mandatory fields or rule violations
+_RED_PROGRESS = frozenset(("Review", "QA"))
+_AMBER_PROGRESS = frozenset(("To Do", "In Progress"))
 
-def render_amber_alert_section(results: list[TaskCompliance]):
-    """Render amber alert for To Do/In Progress tasks missing details or with rule violations."""
-    # Filter: To Do or In Progress with missing mandatory fields or rule violations
-    amber_tasks = [
-        t for t in results
-        if t.progress in ("To Do", "In Progress")
-        and (t.mandatory_count > 0 or getattr(t, 'rule_violations', []))
-    ]
 
-    if not amber_tasks:
+def split_alert_tasks(
+    results: list[TaskCompliance],
+) -> tuple[list[TaskCompliance], list[TaskCompliance]]:
+    """Bucket tasks into (red, amber) alert lists in a single pass."""
+    red_tasks, amber_tasks = [], []
+    for t in results:
+        progress = t.progress
+        if progress in _RED_PROGRESS:
+            if t.missing_fields or t.missing_daily_update or t.rule_violations:
+                red_tasks.append(t)
+        elif progress in _AMBER_PROGRESS:
+            if t.missing_fields or t.rule_violations:
+                amber_tasks.append(t)
+    return red_tasks, amber_tasks
+
+
+def render_red_alert_section(red_tasks: list[TaskCompliance]):
+    """Render red alert for Review/QA tasks with issues."""
+    if not red_tasks:
         return  # Don't show section if no issues
 
-    st.markdown("""
-    <div class="nm-alert nm-alert--warning">
-        <h3>⚠️ Action Required - Tasks Need Attention</h3>
-        <p>These tasks in To Do/In Progress have missing fields or rule violations</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Create header row
-    header_cols = st.columns([3, 1.5, 1, 3, 1])
-    headers = ["Task Name", "Assignee", "Status", "Issues", "Actions"]
-    for i, header in enumerate(headers):
-        header_cols[i].markdown(f"**{header}**")
+    st.markdown(_RED_ALERT_HTML, unsafe_allow_html=True)
 
-    # Create data rows
-    for idx, task in enumerate(amber_tasks):
-        row_cols = st.columns([3, 1.5, 1, 3, 1])
+    # One dataframe; selecting a row opens the task viewer
+    records = [
+        {
+            "Task Name": t.name,
+            "Assignee": t.assignee or "Unassigned",
+            "Status": t.progress or "-",
+            "Issues": _red_alert_issues(t),
+            "Hours Since Update": t.hours_since_update,
+        }
+        for t in red_tasks
+    ]
+    render_task_dataframe(red_tasks, records, {
+        "Task Name": st.column_config.TextColumn("Task Name", width="large"),
+        "Issues": st.column_config.TextColumn("Issues", width="medium"),
+        "Hours Since Update": st.column_config.NumberColumn("Hours Since Update", format="%.0fh"),
+    }, "red")
 
-        # Task name (truncated)
-        task_name = task.name[:35] + "..." if len(task.name) > 35 else task.name
-        row_cols[0].write(task_name)
+    st.markdown("---")
 
-        # Assignee
-        row_cols[1].write(task.assignee or "Unassigned")
 
-        # Status
-        row_cols[2].write(task.progress or "-")
+def render_amber_alert_section(amber_tasks: list[TaskCompliance]):
+    """Render amber alert for To Do/In Progress tasks missing details or with rule violations."""
+    if not amber_tasks:
+        return  # Don't show section if no issues
 
-        # Issues (missing fields + rule violations)
-        all_issues = get_all_issues(task)
-        row_cols[3].write(", ".join(all_issues) if all_issues else "-")
+    st.markdown(_AMBER_ALERT_HTML, unsafe_allow_html=True)
 
-        # Action buttons
-        btn_col1, btn_col2 = row_cols[4].columns(2)
-        if btn_col1.button("👁", key=f"amber_view_{idx}", help="View in app"):
-            st.session_state["selected_task_gid"] = task.gid
-            st.session_state["selected_task_url"] = task.url
-            st.session_state["selected_task_name"] = task.name
-            st.rerun()
-        btn_col2.link_button("🔗",task.url, help="Open in Asana")
+    # One dataframe; selecting a row opens the task viewer
+    records = [
+        {
+            "Task Name": t.name,
+            "Assignee": t.assignee or "Unassigned",
+            "Status": t.progress or "-",
+            "Issues": ", ".join(get_all_issues(t)) or "-",
+        }
+        for t in amber_tasks
+    ]
+    render_task_dataframe(amber_tasks, records, {
+        "Task Name": st.column_config.TextColumn("Task Name", width="large"),
+        "Issues": st.column_config.TextColumn("Issues", width="large"),
+    }, "amber")
 
     st.markdown("---")
 
@@ -2557,55 +2230,78 @@ def render_assignee_table(summary: ReportSummary):
         st.info("No assignee data")
         return
 
-    data = []
-    for assignee, info in summary.by_assignee.items():
-        total = info["total"]
-        issues = info["issues"]
-        compliant = total - issues
-        rate = (compliant / total * 100) if total > 0 else 100
-        data.append({
-            "Assignee": assignee,
-            "Tasks": total,
-            "Compliant": compliant,
-            "Issues": issues,
-            "Compliance": f"{rate:.0f}%"
-        })
+    df = pd.DataFrame.from_dict(summary.by_assignee, orient="index").rename(
+        columns={"total": "Tasks", "issues": "Issues"}
+    )
+    df["Compliant"] = df["Tasks"] - df["Issues"]
+    rate = (df["Compliant"] / df["Tasks"] * 100).where(df["Tasks"] > 0, 100)
+    df["Compliance"] = rate.round().astype(int).astype(str) + "%"
+    df = df.rename_axis("Assignee").reset_index()[["Assignee", "Tasks", "Compliant", "Issues", "Compliance"]]
+
+    st.dataframe(df, use_container_width=True, hide_index=True)
+
+
+def _on_table_select(table_key: str, tasks: list[TaskCompliance]):
+    """Open the task viewer for the row picked in a task dataframe."""
+    rows = st.session_state[table_key].selection.rows
+    if rows:
+        t = tasks[rows[0]]
+        open_task_viewer(t.gid, t.url, t.name)
+
 
-    st.dataframe(data, use_container_width=True, hide_index=True)
+def render_task_dataframe(
+    tasks: list[TaskCompliance],
+    records: list[dict],
+    column_config: dict,
+    table_key: str,
+):
+    """Render task records as a selectable dataframe; selecting a row opens the task viewer."""
+    df = pd.DataFrame.from_records(records)
+    df["Asana"] = [t.url for t in tasks]
+    key = f"table_{table_key}"
+    st.dataframe(
+        df,
+        column_config={
+            **column_config,
+            "Asana": st.column_config.LinkColumn("Asana", display_text="Open", width="small"),
+        },
+        hide_index=True,
+        use_container_width=True,
+        key=key,
+        on_select=functools.partial(_on_table_select, key, tasks),
+        selection_mode="single-row",
+    )
+
+
+# Column name -> value for render_task_table
+_TASK_TABLE_COLUMNS: Mapping[str, Callable[[TaskCompliance], Any]] = MappingProxyType({
+    "Task": lambda t: t.name,
+    "Assignee": lambda t: t.assignee or "Unassigned",
+    "Progress": lambda t: t.progress or "-",
+    "Sprint": lambda t: t.sprint or "-",
+    "Due Date": lambda t: t.due_on or "-",
+    "Hours Since Update": lambda t: t.hours_since_update,
+})
 
 
 def render_task_table(tasks: list[TaskCompliance], title: str, columns: list[str], table_key: str = ""):
-    """Render a task table with expander and view buttons."""
+    """Render the given columns of a task table inside an expander (select a row to view it in the app)."""
     if not tasks:
         return
 
     with st.expander(f"{title} ({len(tasks)} tasks)", expanded=False):
-        # Create header row
-        header_cols = st.columns([3, 2, 1, 1, 1, 1])
-        col_names = ["Task", "Assignee", "Progress", "Sprint", "Due Date", "Actions"]
-        for i, col_name in enumerate(col_names):
-            if i < len(columns) or col_name == "Actions":
-                header_cols[i].markdown(f"**{col_name}**")
-
-        # Create data rows with view buttons
-        for idx, t in enumerate(tasks):
-            row_cols = st.columns([3, 2, 1, 1, 1, 1])
-
-            task_name = t.name[:40] + "..." if len(t.name) > 40 else t.name
-            row_cols[0].write(task_name)
-            row_cols[1].write(t.assignee or "Unassigned")
-            row_cols[2].write(t.progress or "-")
-            row_cols[3].write(t.sprint or "-")
-            row_cols[4].write(t.due_on or "-")
-
-            # Action buttons
-            btn_col1, btn_col2 = row_cols[5].columns(2)
-            if btn_col1.button("👁", key=f"view_{table_key}_{idx}", help="View in app"):
-                st.session_state["selected_task_gid"] = t.gid
-                st.session_state["selected_task_url"] = t.url
-                st.session_state["selected_task_name"] = t.name
-                st.rerun()
-            btn_col2.link_button("🔗",t.url, help="Open in Asana")
+        getters = [(name, _TASK_TABLE_COLUMNS[name]) for name in columns]
+        records = [{name: get(t) for name, get in getters} for t in tasks]
+        render_task_dataframe(tasks, records, {
+            "Task": st.column_config.TextColumn("Task", width="large"),
+            "Hours Since Update": st.column_config.ProgressColumn(
+                "Hours Since Update",
+                help="Hours since the last comment (72h scale)",
+                format="%.0fh",
+                min_value=0,
+                max_value=72,
+            ),
+        }, table_key)
 
 
 def render_rule_violations_table(tasks: list[TaskCompliance], table_key: str = "rule_violations"):
@@ -2614,97 +2310,68 @@ def render_rule_violations_table(tasks: list[TaskCompliance], table_key: str = "
         return
 
     with st.expander(f"🔴 Rule Violations - Epics/Bugs with Story Points ({len(tasks)} tasks)", expanded=False):
-        # Create header row
-        header_cols = st.columns([3, 1.5, 1, 1, 2, 1])
-        col_names = ["Task", "Assignee", "Type", "Points", "Violation", "Actions"]
-        for i, col_name in enumerate(col_names):
-            header_cols[i].markdown(f"**{col_name}**")
-
-        # Create data rows with view buttons
-        for idx, t in enumerate(tasks):
-            row_cols = st.columns([3, 1.5, 1, 1, 2, 1])
-
-            task_name = t.name[:40] + "..." if len(t.name) > 40 else t.name
-            row_cols[0].write(task_name)
-            row_cols[1].write(t.assignee or "Unassigned")
-            row_cols[2].write(t.task_type or "-")
-            row_cols[3].write(t.story_points or "-")
-            violations = getattr(t, 'rule_violations', [])
-            row_cols[4].write(", ".join(violations) if violations else "-")
-
-            # Action buttons
-            btn_col1, btn_col2 = row_cols[5].columns(2)
-            if btn_col1.button("👁", key=f"view_{table_key}_{idx}", help="View in app"):
-                st.session_state["selected_task_gid"] = t.gid
-                st.session_state["selected_task_url"] = t.url
-                st.session_state["selected_task_name"] = t.name
-                st.rerun()
-            btn_col2.link_button("🔗",t.url, help="Open in Asana")
+        records = [
+            {
+                "Task": t.name,
+                "Assignee": t.assignee or "Unassigned",
+                "Type": t.task_type or "-",
+                "Points": t.story_points or "-",
+                "Violation": ", ".join(t.rule_violations) or "-",
+            }
+            for t in tasks
+        ]
+        render_task_dataframe(tasks, records, {
+            "Task": st.column_config.TextColumn("Task", width="large"),
+        }, table_key)
+
+
+_COMPLIANCE_HEADER_HTML = (
+    '<div class="nm-section-compliance">'
+    '<h3>📋 Compliance Details</h3>'
+    '<p>'
+    'Detailed breakdown of tasks with missing or invalid fields</p>'
+    '</div>'
+)
+
+# (TaskCompliance flag, expander title, columns, table key), in display order
+_COMPLIANCE_TABLES = (
+    ("missing_daily_update", "🔴 Missing Daily Updates", ["Task", "Assignee", "Progress", "Hours Since Update"], "updates"),
+    ("missing_epic", "🟠 Missing Epic", ["Task", "Assignee", "Progress"], "epic"),
+    ("missing_sprint", "🟠 Missing Sprint", ["Task", "Assignee", "Progress"], "sprint"),
+    ("missing_type", "🟠 Missing Type", ["Task", "Assignee", "Progress"], "type"),
+    ("missing_points", "🟡 Missing Story Points", ["Task", "Assignee", "Progress"], "points"),
+    ("invalid_points", "🟡 Invalid Story Points (non-Fibonacci)", ["Task", "Assignee", "Progress"], "invalid_points"),
+    ("missing_severity", "🟡 Missing Severity", ["Task", "Assignee", "Progress"], "severity"),
+    ("missing_due_date", "🟡 Missing Due Date", ["Task", "Assignee", "Sprint"], "due"),
+    ("missing_description", "🟡 Missing Description/ACs", ["Task", "Assignee", "Progress"], "desc"),
+)
 
 
 def render_compliance_details(results: list[TaskCompliance]):
     """Render detailed compliance findings."""
-    st.markdown("""
-    <div class="nm-section-compliance">
-        <h3>📋 Compliance Details</h3>
-        <p style="color: #5A6778; margin: 0; font-size: 0.9rem;">Detailed breakdown of tasks with missing or invalid fields</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_COMPLIANCE_HEADER_HTML, unsafe_allow_html=True)
+
+    # Bucket every task into its categories in a single pass
+    rule_violations = []
+    buckets = [[] for _ in _COMPLIANCE_TABLES]
+    for t in results:
+        if t.rule_violations:
+            rule_violations.append(t)
+        for (flag, *_), bucket in zip(_COMPLIANCE_TABLES, buckets):
+            if getattr(t, flag):
+                bucket.append(t)
 
     # Rule Violations (Critical - should be addressed first)
-    rule_violations = [t for t in results if getattr(t, 'rule_violations', [])]
     if rule_violations:
         render_rule_violations_table(rule_violations)
 
-    # Missing Daily Updates (Critical)
-    missing_updates = [t for t in results if t.missing_daily_update]
-    if missing_updates:
-        render_task_table(missing_updates, "🔴 Missing Daily Updates", ["Task", "Assignee", "Progress"], "updates")
-
-    # Missing Epic
-    missing_epic = [t for t in results if t.missing_epic]
-    if missing_epic:
-        render_task_table(missing_epic, "🟠 Missing Epic", ["Task", "Assignee", "Progress"], "epic")
-
-    # Missing Sprint
-    missing_sprint = [t for t in results if t.missing_sprint]
-    if missing_sprint:
-        render_task_table(missing_sprint, "🟠 Missing Sprint", ["Task", "Assignee", "Progress"], "sprint")
-
-    # Missing Type
-    missing_type = [t for t in results if t.missing_type]
-    if missing_type:
-        render_task_table(missing_type, "🟠 Missing Type", ["Task", "Assignee", "Progress"], "type")
-
-    # Missing Story Points
-    missing_points = [t for t in results if t.missing_points]
-    if missing_points:
-        render_task_table(missing_points, "🟡 Missing Story Points", ["Task", "Assignee", "Progress"], "points")
-
-    # Invalid Story Points (non-Fibonacci)
-    invalid_points = [t for t in results if t.invalid_points]
-    if invalid_points:
-        render_task_table(invalid_points, "🟡 Invalid Story Points (non-Fibonacci)", ["Task", "Assignee", "Progress"], "invalid_points")
-
-    # Missing Severity
-    missing_severity = [t for t in results if t.missing_severity]
-    if missing_severity:
-        render_task_table(missing_severity, "🟡 Missing Severity", ["Task", "Assignee", "Progress"], "severity")
-
-    # Missing Due Date
-    missing_due = [t for t in results if t.missing_due_date]
-    if missing_due:
-        render_task_table(missing_due, "🟡 Missing Due Date", ["Task", "Assignee", "Sprint"], "due")
-
-    # Missing Description
-    missing_desc = [t for t in results if t.missing_description]
-    if missing_desc:
-        render_task_table(missing_desc, "🟡 Missing Description/ACs", ["Task", "Assignee", "Progress"], "desc")
+    # Missing daily updates (critical), then mandatory fields
+    for (_, title, columns, table_key), bucket in zip(_COMPLIANCE_TABLES, buckets):
+        if bucket:
+            render_task_table(bucket, title, columns, table_key)
 
     # Show message if all compliant
-    all_issues = (rule_violations + missing_updates + missing_epic + missing_sprint + missing_type +
-                  missing_points + invalid_points + missing_severity + missing_due + missing_desc)
-    if not all_issues:
+    if not rule_violations and not any(buckets):
         st.success("All tasks are fully compliant! No missing fields or rule violations.")
 
 
@@ -2712,67 +2379,101 @@ def render_compliance_details(results: list[TaskCompliance]):
 # Download Buttons
 # =============================================================================
 
+# Report payloads are keyed on the report they came from (its generated_at)
+# plus the gids of the filtered view; TaskCompliance itself is not hashed.
+@st.cache_data(max_entries=16, show_spinner=False)
+def _markdown_report(report_id: str, gids: tuple[str, ...], _results, _summary, _config) -> str:
+    """Markdown report for one filtered view of a report."""
+    return MarkdownReportGenerator(_config).generate(_results, _summary)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _json_report(report_id: str, gids: tuple[str, ...], _results, _summary, _config) -> str:
+    """JSON report for one filtered view of a report."""
+    return JSONReportGenerator(_config).generate(_results, _summary)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _excel_report(
+    report_id: str,
+    gids: tuple[str, ...],
+    completed_gids: tuple[str, ...],
+    _results,
+    _completed,
+    _summary,
+    _config,
+) -> bytes:
+    """Excel workbook bytes for one filtered view (with the invalid-points sheet when there are completed tasks)."""
+    from asana_daily_report import ExcelReportGenerator
+    excel_generator = ExcelReportGenerator(_config)
+    # Use generate_with_completed to include invalid points analysis
+    if _completed:
+        workbook = excel_generator.generate_with_completed(_results, _completed, _summary)
+    else:
+        workbook = excel_generator.generate(_results, _summary)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _prepare_downloads(view_key: tuple):
+    """Mark the current filtered view's reports as requested (Prepare button callback)."""
+    st.session_state["downloads_prepared_for"] = view_key
+
+
 def render_download_buttons(
     results: list[TaskCompliance],
     summary: ReportSummary,
     config: Config,
-    completed_results: Optional[list[TaskCompliance]] = None,
-    filters: Optional[dict] = None
+    filtered_completed: list[TaskCompliance],
+    report_id: str = "",
 ):
-    """Render download buttons."""
-    st.subheader("Download Report")
+    """Render download buttons (payloads cached per report and filtered view).
 
-    # Apply filters to completed_results for Excel report
-    filters = filters or {}
-    filtered_completed = completed_results or []
-    selected_sprint = filters.get("sprint")
-    selected_assignees = filters.get("assignees")
-    selected_statuses = filters.get("statuses")
+    Reports are only built once the user asks for them: a Prepare button is
+    shown until then, and again whenever the filtered view changes.
+    """
+    st.subheader("Download Report")
 
-    if selected_sprint and selected_sprint != "All":
-        filtered_completed = [t for t in filtered_completed if task_in_sprint(t, selected_sprint)]
-    if selected_assignees and len(selected_assignees) > 0:
-        filtered_completed = [t for t in filtered_completed if t.assignee in selected_assignees]
-    if selected_statuses and len(selected_statuses) > 0:
-        filtered_completed = [t for t in filtered_completed if t.progress in selected_statuses]
+    gids = tuple(t.gid for t in results)
+    completed_gids = tuple(t.gid for t in filtered_completed)
+
+    view_key = (report_id, gids, completed_gids)
+    if st.session_state["downloads_prepared_for"] != view_key:
+        st.button(
+            "Prepare Downloads",
+            key="prepare_downloads",
+            on_click=_prepare_downloads,
+            args=(view_key,),
+            help="Build the Markdown, JSON and Excel reports for the current view",
+        )
+        return
 
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        md_generator = MarkdownReportGenerator(config)
-        markdown_content = md_generator.generate(results, summary)
         st.download_button(
             label="Download Markdown",
-            data=markdown_content,
+            data=_markdown_report(report_id, gids, results, summary, config),
             file_name=f"compliance_{summary.report_date}.md",
             mime="text/markdown",
         )
 
     with col2:
-        json_generator = JSONReportGenerator(config)
-        json_content = json_generator.generate(results, summary)
         st.download_button(
             label="Download JSON",
-            data=json_content,
+            data=_json_report(report_id, gids, results, summary, config),
             file_name=f"compliance_{summary.report_date}.json",
             mime="application/json",
         )
 
     with col3:
         if OPENPYXL_AVAILABLE:
-            from asana_daily_report import ExcelReportGenerator
-            excel_generator = ExcelReportGenerator(config)
-            # Use generate_with_completed to include invalid points analysis
-            if filtered_completed:
-                workbook = excel_generator.generate_with_completed(results, filtered_completed, summary)
-            else:
-                workbook = excel_generator.generate(results, summary)
-            buffer = io.BytesIO()
-            workbook.save(buffer)
-            buffer.seek(0)
             st.download_button(
                 label="Download Excel",
-                data=buffer,
+                data=_excel_report(
+                    report_id, gids, completed_gids, results, filtered_completed, summary, config
+                ),
                 file_name=f"compliance_{summary.report_date}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             )
@@ -2784,213 +2485,180 @@ def render_download_buttons(
 # Main App
 # =============================================================================
 
-def render_homepage():
-    """Render the landing page before report generation."""
-    # Hero section with logo and title
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        # Logo
-        logo_path = os.path.join(os.path.dirname(__file__), "assets", "Text-Logo_SourceHub.png")
-        if os.path.exists(logo_path):
-            st.image(logo_path, width=280)
-
-        st.markdown("""
-        <div style="text-align: center; padding: 10px 20px 20px 20px;">
-            <h1 style="font-size: 2.5rem; font-weight: 700; color: #2D3748; margin: 0; letter-spacing: -1px;">
-                Sprint Dashboard
-            </h1>
-            <p style="font-size: 1rem; color: #5A6778; margin-top: 8px;">
-                Development Team Compliance & Burndown Tracking
-            </p>
+# Title and feature cards go out as one markdown element (the logo is an image)
+_HOMEPAGE_HTML = """
+    <div class="nm-hero">
+        <h1>Sprint Dashboard</h1>
+        <p>Development Team Compliance & Burndown Tracking</p>
+    </div>
+    <div class="nm-features">
+        <div class="nm-feature nm-feature--compliance">
+            <div class="nm-feature-icon">&#x2713;</div>
+            <div class="nm-feature-title">Compliance</div>
+            <div class="nm-feature-text">Track task compliance & missing fields</div>
         </div>
-        """, unsafe_allow_html=True)
-
-    # Feature cards
-    st.markdown("""
-    <div style="display: flex; justify-content: center; gap: 20px; flex-wrap: wrap; padding: 30px 20px;">
-        <div style="background: linear-gradient(135deg, #E4E8F0 0%, #DCE2EC 100%);
-                    border-radius: 16px; padding: 24px; width: 200px; text-align: center;
-                    box-shadow: 6px 6px 12px #A3B1C6, -6px -6px 12px #FFFFFF;">
-            <div style="font-size: 2rem; margin-bottom: 8px; color: #6B7FD7;">&#x2713;</div>
-            <div style="font-weight: 600; color: #2D3748; margin-bottom: 4px;">Compliance</div>
-            <div style="font-size: 0.85rem; color: #5A6778;">Track task compliance & missing fields</div>
+        <div class="nm-feature nm-feature--burndown">
+            <div class="nm-feature-icon">&#x2197;</div>
+            <div class="nm-feature-title">Burndown</div>
+            <div class="nm-feature-text">Visualize sprint progress & velocity</div>
         </div>
-        <div style="background: linear-gradient(135deg, #E4F0E8 0%, #DCE8E2 100%);
-                    border-radius: 16px; padding: 24px; width: 200px; text-align: center;
-                    box-shadow: 6px 6px 12px #A3B1C6, -6px -6px 12px #FFFFFF;">
-            <div style="font-size: 2rem; margin-bottom: 8px; color: #5B9A8B;">&#x2197;</div>
-            <div style="font-weight: 600; color: #2D3748; margin-bottom: 4px;">Burndown</div>
-            <div style="font-size: 0.85rem; color: #5A6778;">Visualize sprint progress & velocity</div>
+        <div class="nm-feature nm-feature--alerts">
+            <div class="nm-feature-icon">&#x26A0;</div>
+            <div class="nm-feature-title">Alerts</div>
+            <div class="nm-feature-text">Identify blockers & action items</div>
         </div>
-        <div style="background: linear-gradient(135deg, #F0E8E4 0%, #E8E2DC 100%);
-                    border-radius: 16px; padding: 24px; width: 200px; text-align: center;
-                    box-shadow: 6px 6px 12px #A3B1C6, -6px -6px 12px #FFFFFF;">
-            <div style="font-size: 2rem; margin-bottom: 8px; color: #C9736D;">&#x26A0;</div>
-            <div style="font-weight: 600; color: #2D3748; margin-bottom: 4px;">Alerts</div>
-            <div style="font-size: 0.85rem; color: #5A6778;">Identify blockers & action items</div>
+    </div>
+"""
+
+_TOKEN_NOTICE_HTML = """
+    <div class="nm-notice-wrap">
+        <div class="nm-notice">
+            <p>
+                <span class="nm-notice-icon">&#x26A0;</span> Please enter your <strong>Asana Access Token</strong> in the sidebar to get started.
+            </p>
+            <p class="nm-notice-hint">
+                <a href="https://app.asana.com/0/developer-console" target="_blank">
+                    Get your token from Asana Developer Console &#x2192;
+                </a>
+            </p>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+"""
 
 
-def main():
-    """Main application."""
-    init_session_state()
+LOGO_PATH = Path(__file__).parent / "assets" / "Text-Logo_SourceHub.png"
 
-    # Check if passcode is required and user is not authenticated
-    if get_app_passcode() and not st.session_state.get("authenticated", False):
-        render_login_screen()
-        return
 
-    # Sidebar - always render for configuration
-    config_options = render_sidebar()
+@functools.lru_cache(maxsize=1)
+def _logo_path() -> Optional[str]:
+    """The logo file path, or None when it is missing (checked once per process)."""
+    return str(LOGO_PATH) if LOGO_PATH.exists() else None
 
-    # PRIORITY: Check if generating - show ONLY loader, nothing else
-    if st.session_state.get("is_generating", False):
-        # Neumorphic loader container with status
-        st.markdown("""
-        <style>
-            @keyframes spin {
-                0% { transform: rotate(0deg); }
-                100% { transform: rotate(360deg); }
-            }
-        </style>
-        <div style="display: flex; flex-direction: column; align-items: center; justify-content: center;
-                    min-height: 50vh; text-align: center;">
-            <div style="background: #E4E8EC; border-radius: 20px; padding: 40px 50px;
-                        box-shadow: 8px 8px 16px #A3B1C6, -8px -8px 16px #FFFFFF;">
-                <div style="width: 60px; height: 60px; margin: 0 auto 20px auto;
-                            border: 4px solid #E4E8EC; border-top: 4px solid #6B7FD7;
-                            border-radius: 50%; animation: spin 1s linear infinite;
-                            box-shadow: inset 2px 2px 4px #A3B1C6, inset -2px -2px 4px #FFFFFF;">
-                </div>
-                <div style="font-size: 1.2rem; color: #2D3748; font-weight: 600; margin-bottom: 8px;">
-                    Generating Report
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
 
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            try:
-                with st.status("Loading...", expanded=True) as status:
-                    st.write("Initializing compliance reporter...")
-                    config = Config(
-                        min_description_length=config_options["min_description_length"],
-                        hours_without_update=config_options["hours_without_update"],
-                    )
-                    reporter = AsanaComplianceReporter(config_options["token"], config)
-
-                    st.write("Fetching active tasks from Asana...")
-                    tasks = reporter.client.get_tasks(completed=False)
-                    st.write(f"Found {len(tasks)} active tasks")
-
-                    completed_tasks = []
-                    if config_options["fetch_completed"]:
-                        st.write("Fetching completed tasks from last 30 days...")
-                        completed_tasks = reporter.client.get_completed_tasks(since_days=30)
-                        st.write(f"Found {len(completed_tasks)} completed tasks")
-
-                    st.write("Analyzing task compliance...")
-                    results = reporter.analyzer.analyze_all(
-                        tasks,
-                        fetch_comments=config_options["fetch_comments"]
-                    )
-
-                    completed_results = []
-                    if completed_tasks:
-                        st.write("Analyzing completed tasks...")
-                        completed_results = reporter.analyzer.analyze_all(
-                            completed_tasks,
-                            fetch_comments=False,
-                            include_done=True
-                        )
-
-                    st.write("Generating summary report...")
-                    summary = reporter.analyzer.generate_summary(results)
-
-                    # Store results
-                    st.session_state["results"] = results
-                    st.session_state["completed_results"] = completed_results
-                    st.session_state["summary"] = summary
-                    st.session_state["config"] = config
-                    st.session_state["reporter"] = reporter
-                    st.session_state["report_generated"] = True
-                    st.session_state["is_generating"] = False
-
-                    status.update(label="Report generated!", state="complete", expanded=False)
-
-                st.rerun()
-            except Exception as e:
-                st.session_state["is_generating"] = False
-                error_str = str(e).lower()
-                if any(x in error_str for x in ["401", "403", "unauthorized", "forbidden"]):
-                    st.error("Authentication failed. Please check your access token.")
-                elif "rate limit" in error_str or "429" in error_str:
-                    st.error("Rate limit exceeded. Please wait and try again.")
-                else:
-                    st.error(f"Error generating report: {e}")
-        st.stop()  # Ensure nothing else renders
-        return
+def render_homepage(show_token_notice: bool = False):
+    """Render the landing page before report generation."""
+    # Hero section with logo
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        logo_path = _logo_path()
+        if logo_path:
+            st.image(logo_path, width=280)
 
-    # Check token
-    if not config_options["token"]:
-        render_homepage()
-        st.markdown("""
-        <div style="text-align: center; padding: 20px;">
-            <div style="background: linear-gradient(135deg, #F5F0E0 0%, #EDE8D4 100%);
-                        border-radius: 12px; padding: 20px; display: inline-block;
-                        border-left: 4px solid #D4A574;
-                        box-shadow: 4px 4px 8px #A3B1C6, -4px -4px 8px #FFFFFF;">
-                <p style="color: #7A6830; margin: 0; font-size: 0.95rem;">
-                    <span style="color: #D4A574;">&#x26A0;</span> Please enter your <strong>Asana Access Token</strong> in the sidebar to get started.
-                </p>
-                <p style="color: #5A6778; margin: 8px 0 0 0; font-size: 0.85rem;">
-                    <a href="https://app.asana.com/0/developer-console" target="_blank" style="color: #6B7FD7;">
-                        Get your token from Asana Developer Console &#x2192;
-                    </a>
-                </p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        return
+    html = _HOMEPAGE_HTML + _TOKEN_NOTICE_HTML if show_token_notice else _HOMEPAGE_HTML
+    st.markdown(html, unsafe_allow_html=True)
 
-    # Show homepage with Generate button if report not generated
-    if not st.session_state.get("report_generated"):
-        render_homepage()
 
-        col1, col2, col3 = st.columns([1, 1, 1])
-        with col2:
-            if st.button("Generate Report", type="primary", use_container_width=True):
-                st.session_state["is_generating"] = True
-                st.rerun()
-        return
+# =============================================================================
+# Dashboard Body (fragment)
+# =============================================================================
 
-    # Report is generated - show dashboard header
-    st.markdown("""
-    <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 8px;">
-        <h1 style="font-size: 2rem; font-weight: 700; color: #2D3748; margin: 0;">
-            Sprint Dashboard
-        </h1>
-    </div>
-    """, unsafe_allow_html=True)
-    st.caption("SourceHub Development Team")
+@st.cache_data(max_entries=64, show_spinner=False)
+def _filtered_summary_and_metrics(
+    report_id: str,
+    sprint: Optional[str],
+    assignees: tuple[str, ...],
+    statuses: tuple[str, ...],
+    _filtered_results: list[TaskCompliance],
+    _analyzer,
+    _frame: Optional[pd.DataFrame] = None,
+    _positions: Optional[list[int]] = None,
+) -> tuple[ReportSummary, dict]:
+    """Summary and sprint metrics for one filter combination of one report.
+
+    Keyed on the report and the filter values only; returning to a previously
+    viewed combination skips both passes over the filtered tasks. With the
+    report's results frame, the filtered rows are aggregated column-wise.
+    """
+    if _frame is not None:
+        return _analyzer.summarize_frame(_frame if _positions is None else _frame.iloc[_positions])
+    return (
+        _analyzer.generate_summary(_filtered_results),
+        _analyzer.calculate_sprint_metrics(_filtered_results),
+    )
 
-    # Report is generated - show dashboard
-    results = st.session_state["results"]
-    completed_results = st.session_state.get("completed_results", [])
-    summary = st.session_state["summary"]
-    config = st.session_state["config"]
-    reporter = st.session_state["reporter"]
 
+class FilteredView(NamedTuple):
+    """Everything the dashboard body derives from the filters."""
+    results: list[TaskCompliance]
+    summary: ReportSummary
+    metrics: dict
+    stats: SprintStats  # sprint totals for the progress bar, burndown and assignee charts
+    completed: list[TaskCompliance]  # for the invalid-points section and Excel download
+
+
+def filtered_view(
+    results: list[TaskCompliance],
+    completed_results: list[TaskCompliance],
+    summary: ReportSummary,
+    filters: dict,
+    reporter,
+    completed_task_index: Optional[TaskIndex] = None,
+    task_index: Optional[TaskIndex] = None,
+    results_frame: Optional[pd.DataFrame] = None,
+) -> FilteredView:
+    """Apply the filters, reusing the session's last view while its fingerprint matches."""
+    sprint = filters.get("sprint")
+    assignees = tuple(sorted(filters.get("assignees") or ()))
+    statuses = tuple(sorted(filters.get("statuses") or ()))
+    fingerprint = (summary.generated_at, sprint, assignees, statuses)
+    cached = st.session_state.get("filtered_view")
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    positions = None
+    if task_index is not None:
+        positions = filter_positions(filters, task_index)
+        filtered_results = results if positions is None else [results[i] for i in positions]
+    else:
+        filtered_results = reporter.analyzer.filter_results(
+            results, sprint=sprint, assignees=filters.get("assignees"), statuses=filters.get("statuses"),
+        )
+    filtered_summary, metrics = _filtered_summary_and_metrics(
+        summary.generated_at,
+        sprint,
+        assignees,
+        statuses,
+        filtered_results,
+        reporter.analyzer,
+        results_frame if task_index is not None else None,
+        positions,
+    )
+    view = FilteredView(
+        filtered_results,
+        filtered_summary,
+        metrics,
+        sprint_stats(filtered_results, completed_results, sprint, completed_task_index),
+        _apply_task_filters(completed_results or [], filters, completed_task_index),
+    )
+    st.session_state["filtered_view"] = (fingerprint, view)
+    return view
+
+
+@st.fragment
+def render_dashboard_body(
+    results: list[TaskCompliance],
+    completed_results: list[TaskCompliance],
+    summary: ReportSummary,
+    config: Config,
+    reporter,
+    token_hash: str,
+    completed_task_index: Optional[TaskIndex] = None,
+    task_index: Optional[TaskIndex] = None,
+    results_frame: Optional[pd.DataFrame] = None,
+):
+    """Render filters and every filtered view.
+
+    Runs as a fragment, so filter changes rerun only this part of the page
+    (not the sidebar, CSS or login guard).
+    """
     # Check if task viewer dialog should be opened
     if st.session_state.get("selected_task_gid"):
         show_task_dialog(
             st.session_state["selected_task_gid"],
             st.session_state.get("selected_task_url", ""),
             st.session_state.get("selected_task_name", "Task"),
-            reporter
+            reporter,
+            token_hash,
         )
         # Clear the selection after dialog is shown
         st.session_state["selected_task_gid"] = None
@@ -2998,17 +2666,15 @@ def main():
         st.session_state["selected_task_name"] = None
 
     # Dashboard filters (horizontal layout)
-    filters = render_dashboard_filters(results, completed_results, reporter.analyzer)
-
-    # Apply filters
-    filtered_results = reporter.analyzer.filter_results(
-        results,
-        sprint=filters.get("sprint"),
-        assignees=filters.get("assignees"),
-        statuses=filters.get("statuses"),
+    filters = render_dashboard_filters(st.session_state["tasks_df"], summary.generated_at)
+
+    # Filter-dependent data; reruns that leave the filters unchanged (table
+    # selections, "show more" toggles, ...) reuse it from session state
+    view = filtered_view(
+        results, completed_results, summary, filters, reporter,
+        completed_task_index, task_index, results_frame,
     )
-    filtered_summary = reporter.analyzer.generate_summary(filtered_results)
-    metrics = reporter.analyzer.calculate_sprint_metrics(filtered_results)
+    filtered_results, filtered_summary, metrics, stats, filtered_completed = view
 
     # Report info
     st.caption(f"Report Date: {summary.report_date} | Showing: {len(filtered_results)} tasks")
@@ -3021,21 +2687,21 @@ def main():
     st.markdown("---")
 
     # Sprint Progress Bar (Quick Wins)
-    render_sprint_progress_bar(filtered_results, completed_results, filters.get("sprint"))
+    render_sprint_progress_bar(stats)
 
     # Charts row: Burndown and Points by Assignee side by side
     col_burndown, col_assignee = st.columns([3, 2])
 
     with col_burndown:
         # Burndown chart
-        render_burndown_chart(filtered_results, completed_results, filters.get("sprint"))
+        render_burndown_chart(stats, filters.get("sprint"))
 
     with col_assignee:
         # Points by Assignee Chart (Quick Wins)
-        render_points_by_assignee_chart(filtered_results, completed_results, filters.get("sprint"))
+        render_points_by_assignee_chart(stats)
 
     # Bug Count by Assignee Chart
-    render_bug_count_chart(filtered_results, completed_results, filters.get("sprint"))
+    render_bug_count_chart(filtered_results, completed_results, filters.get("sprint"), completed_task_index)
 
     st.markdown("---")
 
@@ -3044,25 +2710,28 @@ def main():
     col_team, col_individual = st.columns(2)
 
     with col_team:
-        team_data = render_team_completion_chart(completed_results, filters, filters.get("sprint"))
+        team_data = render_team_completion_chart(completed_results, filters, filters.get("sprint"), completed_task_index)
 
     with col_individual:
-        render_individual_completion_chart(completed_results, filters, filters.get("sprint"), team_data)
+        render_individual_completion_chart(
+            completed_results, filters, filters.get("sprint"), team_data, completed_task_index
+        )
 
     st.markdown("---")
 
     # Invalid Story Points Alert (Quick Wins) - Shows both active and completed tasks
-    render_invalid_story_points_section(filtered_results, completed_results, filters)
+    render_invalid_story_points_section(filtered_results, filtered_completed)
 
-    # Overdue Tasks Alert (Quick Wins) - Most critical first
-    render_overdue_alert_section(filtered_results)
-
-    # Due This Week Alert (Quick Wins)
-    render_due_this_week_section(filtered_results)
+    # Overdue Tasks Alert (Quick Wins) - Most critical first, then Due This Week;
+    # each section renders nothing when its list is empty
+    overdue_tasks, due_soon = split_due_tasks(filtered_results)
+    render_overdue_alert_section(overdue_tasks)
+    render_due_this_week_section(due_soon)
 
     # Alert sections (red first - more critical, then amber)
-    render_red_alert_section(filtered_results)
-    render_amber_alert_section(filtered_results)
+    red_tasks, amber_tasks = split_alert_tasks(filtered_results)
+    render_red_alert_section(red_tasks)
+    render_amber_alert_section(amber_tasks)
 
     # Compliance summary
     col1, col2 = st.columns(2)
@@ -3079,7 +2748,158 @@ def main():
     st.markdown("---")
 
     # Download buttons
-    render_download_buttons(filtered_results, filtered_summary, config, completed_results, filters)
+    render_download_buttons(
+        filtered_results, filtered_summary, config, filtered_completed, report_id=summary.generated_at
+    )
+
+
+_LOADER_HTML = """
+    <div class="nm-loader">
+        <div class="nm-loader-card">
+            <div class="nm-spinner"></div>
+            <div class="nm-loader-title">Generating Report</div>
+        </div>
+    </div>
+"""
+
+_DASHBOARD_HEADER_HTML = """
+    <div class="nm-page-header">
+        <h1>Sprint Dashboard</h1>
+    </div>
+"""
+
+
+# Classify Asana API failures from the exception text
+_AUTH_ERROR_RE = re.compile(r"\b(?:401|403)\b|unauthorized|forbidden", re.IGNORECASE)
+_RATE_LIMIT_ERROR_RE = re.compile(r"\b429\b|rate limit", re.IGNORECASE)
+
+
+def generate_report(config_options: dict) -> bool:
+    """Fetch and analyze tasks behind a loader, storing the report in session state.
+
+    Returns False (with the error shown under the loader) if generation fails.
+    """
+    # Neumorphic loader container with status
+    st.markdown(_LOADER_HTML, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        try:
+            with st.status("Loading...", expanded=True) as status:
+                # One element, overwritten as each stage finishes
+                log = st.empty()
+                log.write("Fetching and analyzing tasks from Asana...")
+                config = Config(
+                    min_description_length=config_options["min_description_length"],
+                    hours_without_update=config_options["hours_without_update"],
+                )
+                reporter = _get_reporter(
+                    hash_token(config_options["token"]),
+                    config.min_description_length,
+                    config.hours_without_update,
+                    _token=config_options["token"],
+                )
+
+                # Report each stage as it completes
+                for message, report in _run_report(
+                    config_options["token"],
+                    config_options["fetch_comments"],
+                    config_options["fetch_completed"],
+                    config_options["min_description_length"],
+                    config_options["hours_without_update"],
+                    reporter.analyzer,
+                ):
+                    status.update(label=message)
+                    log.write(message)
+                results, completed_results, summary, tasks_df = report
+
+                # Store results
+                st.session_state["results"] = results
+                st.session_state["completed_results"] = completed_results
+                st.session_state["completed_task_index"] = build_task_index(completed_results)
+                st.session_state["task_index"] = build_task_index(results)
+                st.session_state["results_frame"] = reporter.analyzer.results_frame(results)
+                st.session_state["summary"] = summary
+                st.session_state["tasks_df"] = tasks_df
+                st.session_state["config"] = config
+                st.session_state["report_generated"] = True
+
+                status.update(label="Report generated!", state="complete", expanded=False)
+            return True
+        except Exception as e:
+            error_str = str(e)
+            if _AUTH_ERROR_RE.search(error_str):
+                st.error("Authentication failed. Please check your access token.")
+            elif _RATE_LIMIT_ERROR_RE.search(error_str):
+                st.error("Rate limit exceeded. Please wait and try again.")
+            else:
+                st.error(f"Error generating report: {e}")
+            return False
+
+
+def main():
+    """Main application."""
+    init_session_state()
+
+    # No passcode configured - nothing to log in to
+    if not get_app_passcode():
+        st.session_state["authenticated"] = True
+
+    # Passcode required and user is not authenticated
+    if not st.session_state.get("authenticated", False):
+        render_login_screen()
+        return
+
+    # Sidebar - always render for configuration
+    config_options = render_sidebar()
+
+    # Check token
+    if not config_options["token"]:
+        render_homepage(show_token_notice=True)
+        return
+
+    # Show homepage with Generate button if report not generated. The click is
+    # handled in this same run: the loader replaces the homepage, and on success
+    # the dashboard renders below without another rerun.
+    if not st.session_state.get("report_generated"):
+        page = st.empty()
+        with page.container():
+            render_homepage()
+
+            col1, col2, col3 = st.columns([1, 1, 1])
+            with col2:
+                clicked = st.button("Generate Report", type="primary", use_container_width=True)
+        if not clicked:
+            return
+        with page.container():
+            if not generate_report(config_options):
+                return
+        page.empty()
+
+    # Report is generated - show dashboard header
+    st.markdown(_DASHBOARD_HEADER_HTML, unsafe_allow_html=True)
+    st.caption("SourceHub Development Team")
+
+    # Report is generated - show dashboard
+    results = st.session_state["results"]
+    completed_results = st.session_state.get("completed_results", [])
+    summary = st.session_state["summary"]
+    config = st.session_state["config"]
+    token_hash = hash_token(config_options["token"])
+    reporter = _get_reporter(
+        token_hash,
+        config.min_description_length,
+        config.hours_without_update,
+        _token=config_options["token"],
+    )
+
+    # Filters and everything they drive rerun as one fragment
+    render_dashboard_body(
+        results, completed_results, summary, config, reporter, token_hash,
+        st.session_state.get("completed_task_index"),
+        st.session_state.get("task_index"),
+        st.session_state.get("results_frame"),
+    )
 
 
 if __name__ == "__main__":
@@ -32,14 +32,18 @@ Environment Variables:
     ASANA_ACCESS_TOKEN - Your Asana Personal Access Token
 """
 
+import functools
+import importlib.util
 import os
+import re
 import sys
 import json
+import math
 import argparse
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
-from dataclasses import dataclass, field, asdict
+from typing import TYPE_CHECKING, Optional
+from dataclasses import MISSING, dataclass, field, fields, asdict
 from collections import defaultdict
 
 try:
@@ -55,21 +59,13 @@ try:
 except ImportError:
     pass
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# rich (console summary) and openpyxl (Excel export) are imported on first use,
+# so importing this module (e.g. from the dashboard) doesn't pay for them
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+OPENPYXL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
 
-try:
+if TYPE_CHECKING:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
-    from openpyxl.worksheet.hyperlink import Hyperlink
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
 
 
 # =============================================================================
@@ -137,6 +133,29 @@ class Config:
 # Data Models
 # =============================================================================
 
+# Plain decimal numbers only (rejects "None", "nan", "inf" and the like)
+_NUMERIC_RE = re.compile(r"\s*[-+]?(\d+\.?\d*|\.\d+)\s*")
+
+
+def shorten(text: str, limit: int) -> str:
+    """Truncate text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit - 1] + "\u2026"
+
+
+# Logical order for progress statuses; unknown statuses follow alphabetically
+STATUS_ORDER = ("To Do", "In Progress", "Review", "QA", "Done", "Backlog")
+
+
+def natural_sort_key(s: str):
+    """Sort strings with embedded numbers naturally (Sprint 2 before Sprint 10)."""
+    return [int(x) if x.isdigit() else x.lower() for x in re.split(r'(\d+)', s)]
+
+
+def order_statuses(statuses: set[str]) -> list[str]:
+    """Order statuses by STATUS_ORDER, then any others alphabetically."""
+    return [s for s in STATUS_ORDER if s in statuses] + sorted(statuses - set(STATUS_ORDER))
+
+
 @dataclass
 class TaskCompliance:
     """Compliance analysis of a single task."""
@@ -191,6 +210,27 @@ class TaskCompliance:
     days_until_due: Optional[int] = None  # Negative if overdue
     task_age_days: int = 0  # Days since created
 
+    def __post_init__(self) -> None:
+        # Parsed once at ingest (not dataclass fields, so asdict/JSON is unchanged)
+        sp = self.story_points
+        self.points = float(sp) if sp and _NUMERIC_RE.fullmatch(sp) else math.nan
+        self.sprints = tuple(s.strip() for s in self.sprint.split(",")) if self.sprint else ()
+
+    def __setstate__(self, state: dict) -> None:
+        # Instances pickled by an older version (e.g. held in the Streamlit
+        # cache) get defaults for fields added since, once at load
+        self.__dict__.update(state)
+        for f in fields(self):
+            if f.name not in state and (f.default is not MISSING or f.default_factory is not MISSING):
+                setattr(self, f.name, f.default if f.default is not MISSING else f.default_factory())
+        if "points" not in state:
+            self.__post_init__()
+
+    @property
+    def points_or_zero(self) -> float:
+        """Story points as a number, with missing/non-numeric values counted as 0."""
+        return 0.0 if math.isnan(self.points) else self.points
+
     @property
     def mandatory_missing(self) -> list[str]:
         """List of missing or invalid mandatory attributes."""
@@ -213,6 +253,24 @@ class TaskCompliance:
             missing.append("Description/ACs")
         return missing
 
+    @functools.cached_property
+    def missing_fields(self) -> tuple[str, ...]:
+        """Short labels for missing/invalid mandatory attributes (dashboard alerts).
+
+        Computed on first access, so read it only once analysis has set the flags.
+        """
+        labels = (
+            (self.missing_epic, "Epic"),
+            (self.missing_sprint, "Sprint"),
+            (self.missing_type, "Type"),
+            (self.missing_points, "Story Points"),
+            (self.invalid_points, "Invalid Points"),
+            (self.missing_severity, "Severity"),
+            (self.missing_due_date, "Due Date"),
+            (self.missing_description, "Description/ACs"),
+        )
+        return tuple(label for flag, label in labels if flag)
+
     @property
     def mandatory_count(self) -> int:
         return len(self.mandatory_missing)
@@ -413,9 +471,22 @@ class ComplianceAnalyzer:
     def __init__(self, config: Config, client: AsanaClient):
         self.config = config
         self.client = client
+        # Hashed lookup; whole floats match their int members (3.0 in {3})
+        self._valid_points = frozenset(config.valid_story_points)
 
-    def analyze_task(self, task: dict, fetch_comments: bool = True) -> TaskCompliance:
-        """Analyze a single task for compliance."""
+    def analyze_task(
+        self,
+        task: dict,
+        fetch_comments: bool = True,
+        comments: Optional[list[dict]] = None
+    ) -> TaskCompliance:
+        """Analyze a single task for compliance.
+
+        Args:
+            task: Task dictionary from Asana API
+            fetch_comments: Whether to check daily updates on active tasks
+            comments: Pre-fetched comments for the task; fetched from the API if None
+        """
         gid = task.get('gid', '')
         name = task.get('name', '(unnamed)')
 
@@ -509,13 +580,8 @@ class ComplianceAnalyzer:
         # Check if story points are valid Fibonacci numbers (0, 1, 2, 3, 5, 8, 13)
         # Skip validation for types that shouldn't have points
         if not compliance.missing_points and task_type not in self.config.types_without_points:
-            try:
-                points_value = float(story_points)
-                # Check if it's a whole number and in the valid list
-                if points_value != int(points_value) or int(points_value) not in self.config.valid_story_points:
-                    compliance.invalid_points = True
-            except (ValueError, TypeError):
-                compliance.invalid_points = True
+            # Non-numeric points parse to NaN, which is never a member
+            compliance.invalid_points = compliance.points not in self._valid_points
 
         compliance.missing_severity = not severity or severity.strip() == ''
         compliance.missing_due_date = due_on is None
@@ -541,8 +607,9 @@ class ComplianceAnalyzer:
                 except (ValueError, TypeError):
                     pass
 
-            # Fetch comments
-            comments = self.client.get_task_comments(gid, limit=5)
+            # Fetch comments (unless the caller already did)
+            if comments is None:
+                comments = self.client.get_task_comments(gid, limit=5)
             compliance.total_comments = len(comments)
 
             if comments:
@@ -576,11 +643,26 @@ class ComplianceAnalyzer:
 
         return compliance
 
+    def task_progress(self, task: dict) -> Optional[str]:
+        """Get the Progress custom field value from a raw task dictionary."""
+        for cf in (task.get('custom_fields') or []):
+            if cf and cf.get('gid') == self.config.progress_field_gid:
+                return cf.get('display_value')
+        return None
+
+    def tasks_needing_comments(self, tasks: list[dict]) -> list[str]:
+        """GIDs of tasks whose daily updates are checked (active statuses)."""
+        return [
+            task.get('gid', '') for task in tasks
+            if self.task_progress(task) in self.config.active_statuses
+        ]
+
     def analyze_all(
         self,
         tasks: list[dict],
         fetch_comments: bool = True,
-        include_done: bool = False
+        include_done: bool = False,
+        comments_by_gid: Optional[dict[str, list[dict]]] = None
     ) -> list[TaskCompliance]:
         """Analyze all tasks for compliance.
 
@@ -589,6 +671,8 @@ class ComplianceAnalyzer:
             fetch_comments: Whether to fetch comments for active tasks
             include_done: If True, include Done tasks (useful for burndown charts).
                          If False (default), skip Done tasks for compliance analysis.
+            comments_by_gid: Pre-fetched comments keyed by task GID; tasks not in
+                         the mapping fall back to fetching from the API.
         """
         results = []
         total = len(tasks)
@@ -597,11 +681,7 @@ class ComplianceAnalyzer:
 
         for i, task in enumerate(tasks, 1):
             # Get progress status
-            progress = None
-            for cf in (task.get('custom_fields') or []):
-                if cf and cf.get('gid') == self.config.progress_field_gid:
-                    progress = cf.get('display_value')
-                    break
+            progress = self.task_progress(task)
 
             # Skip Done tasks (unless include_done is True)
             if progress == 'Done' and not include_done:
@@ -616,7 +696,8 @@ class ComplianceAnalyzer:
             if i % 10 == 0:
                 print(f"  Analyzing task {i}/{total}...")
 
-            compliance = self.analyze_task(task, fetch_comments=fetch_comments)
+            comments = comments_by_gid.get(task.get('gid', '')) if comments_by_gid is not None else None
+            compliance = self.analyze_task(task, fetch_comments=fetch_comments, comments=comments)
             results.append(compliance)
 
         print(f"  Skipped {skipped_done} Done tasks, {skipped_backlog} Backlog tasks")
@@ -624,7 +705,6 @@ class ComplianceAnalyzer:
 
     def get_unique_sprints(self, results: list[TaskCompliance]) -> list[str]:
         """Extract unique sprint values from results, sorted naturally (Sprint 2 before Sprint 10)."""
-        import re
         sprints = set()
         for task in results:
             if task.sprint and task.sprint.strip():
@@ -633,11 +713,6 @@ class ComplianceAnalyzer:
                     s = s.strip()
                     if s:
                         sprints.add(s)
-
-        def natural_sort_key(s: str):
-            """Sort strings with embedded numbers naturally."""
-            return [int(x) if x.isdigit() else x.lower() for x in re.split(r'(\d+)', s)]
-
         return sorted(sprints, key=natural_sort_key)
 
     def get_unique_assignees(self, results: list[TaskCompliance]) -> list[str]:
@@ -654,9 +729,7 @@ class ComplianceAnalyzer:
         for task in results:
             if task.progress:
                 statuses.add(task.progress)
-        # Return in logical order
-        status_order = ["To Do", "In Progress", "Review", "QA", "Done", "Backlog"]
-        return [s for s in status_order if s in statuses] + sorted(statuses - set(status_order))
+        return order_statuses(statuses)
 
     def get_unique_epics(self, results: list[TaskCompliance]) -> list[str]:
         """Extract unique epic values from results, sorted."""
@@ -695,24 +768,18 @@ class ComplianceAnalyzer:
 
         # Filter by sprint (handles comma-separated sprint values like "Manali, London")
         if sprint and sprint != "All":
-            def task_in_sprint(task: TaskCompliance) -> bool:
-                if not task.sprint:
-                    return False
-                task_sprints = [s.strip() for s in task.sprint.split(",")]
-                return sprint in task_sprints
-            filtered = [t for t in filtered if task_in_sprint(t)]
-
-        # Filter by assignees
-        if assignees and len(assignees) > 0:
-            filtered = [t for t in filtered if t.assignee in assignees]
-
-        # Filter by statuses
-        if statuses and len(statuses) > 0:
-            filtered = [t for t in filtered if t.progress in statuses]
-
-        # Filter by epics
-        if epics and len(epics) > 0:
-            filtered = [t for t in filtered if t.epic in epics]
+            filtered = [t for t in filtered if sprint in t.sprints]
+
+        # Filter by assignees, statuses and epics (sets: O(1) membership per task)
+        if assignees:
+            assignee_set = set(assignees)
+            filtered = [t for t in filtered if t.assignee in assignee_set]
+        if statuses:
+            status_set = set(statuses)
+            filtered = [t for t in filtered if t.progress in status_set]
+        if epics:
+            epic_set = set(epics)
+            filtered = [t for t in filtered if t.epic in epic_set]
 
         # Filter by due date range
         if due_date_start:
@@ -748,24 +815,17 @@ class ComplianceAnalyzer:
         """
         total_points = 0
         completed_points = 0
-        points_by_status = {}
-        tasks_by_status = {}
-        points_by_assignee = {}
+        points_by_status = defaultdict(float)
+        tasks_by_status = defaultdict(int)
+        points_by_assignee = defaultdict(float)
 
         for task in results:
-            # Parse story points
-            try:
-                points = float(task.story_points) if task.story_points else 0
-            except (ValueError, TypeError):
-                points = 0
+            points = task.points_or_zero
 
             total_points += points
 
             # By status
             status = task.progress or "Unknown"
-            if status not in points_by_status:
-                points_by_status[status] = 0
-                tasks_by_status[status] = 0
             points_by_status[status] += points
             tasks_by_status[status] += 1
 
@@ -774,10 +834,7 @@ class ComplianceAnalyzer:
                 completed_points += points
 
             # By assignee
-            assignee = task.assignee or "Unassigned"
-            if assignee not in points_by_assignee:
-                points_by_assignee[assignee] = 0
-            points_by_assignee[assignee] += points
+            points_by_assignee[task.assignee or "Unassigned"] += points
 
         remaining_points = total_points - completed_points
         avg_points = total_points / len(results) if results else 0
@@ -786,8 +843,8 @@ class ComplianceAnalyzer:
             "total_points": total_points,
             "completed_points": completed_points,
             "remaining_points": remaining_points,
-            "points_by_status": points_by_status,
-            "tasks_by_status": tasks_by_status,
+            "points_by_status": dict(points_by_status),
+            "tasks_by_status": dict(tasks_by_status),
             "points_by_assignee": dict(sorted(
                 points_by_assignee.items(),
                 key=lambda x: x[1],
@@ -848,21 +905,13 @@ class ComplianceAnalyzer:
             # Quick Wins: Count overdue and due this week
             if task.is_overdue:
                 summary.overdue_tasks += 1
-                try:
-                    points = float(task.story_points) if task.story_points else 0
-                    summary.overdue_points += points
-                except (ValueError, TypeError):
-                    pass
+                summary.overdue_points += task.points_or_zero
 
             if (task.days_until_due is not None
                 and 0 <= task.days_until_due <= 7
                 and task.progress != "Done"):
                 summary.due_this_week += 1
-                try:
-                    points = float(task.story_points) if task.story_points else 0
-                    summary.due_this_week_points += points
-                except (ValueError, TypeError):
-                    pass
+                summary.due_this_week_points += task.points_or_zero
 
             # By assignee
             by_assignee[task.assignee]["total"] += 1
@@ -880,6 +929,111 @@ class ComplianceAnalyzer:
 
         return summary
 
+    # Flags counted by generate_summary, as (results_frame column, summary field)
+    _SUMMARY_FLAG_FIELDS = (
+        ("missing_epic", "missing_epic"),
+        ("missing_sprint", "missing_sprint"),
+        ("missing_type", "missing_type"),
+        ("missing_points", "missing_points"),
+        ("invalid_points", "invalid_points"),
+        ("missing_severity", "missing_severity"),
+        ("missing_due_date", "missing_due_date"),
+        ("missing_description", "missing_description"),
+        ("has_rule_violations", "rule_violations"),
+        ("is_todo", "tasks_todo"),
+        ("is_compliant", "compliant_tasks"),
+        ("is_overdue", "overdue_tasks"),
+        ("due_this_week", "due_this_week"),
+    )
+
+    def results_frame(self, results: list[TaskCompliance]):
+        """Columnar view (pandas DataFrame, one row per task) of what the summaries aggregate.
+
+        Built once per analysis; slicing it by row position gives the frame for
+        any filtered subset, which summarize_frame aggregates without a Python loop.
+        """
+        import pandas as pd
+
+        return pd.DataFrame({
+            "assignee": [t.assignee for t in results],
+            "progress": [t.progress for t in results],
+            "points": [t.points_or_zero for t in results],
+            "missing_epic": [t.missing_epic for t in results],
+            "missing_sprint": [t.missing_sprint for t in results],
+            "missing_type": [t.missing_type for t in results],
+            "missing_points": [t.missing_points for t in results],
+            "invalid_points": [t.invalid_points for t in results],
+            "missing_severity": [t.missing_severity for t in results],
+            "missing_due_date": [t.missing_due_date for t in results],
+            "missing_description": [t.missing_description for t in results],
+            "has_rule_violations": [bool(t.rule_violations) for t in results],
+            "needs_daily_update": [t.needs_daily_update for t in results],
+            "missing_daily_update": [t.missing_daily_update for t in results],
+            "is_todo": [t.is_todo for t in results],
+            "is_compliant": [t.is_compliant for t in results],
+            "is_overdue": [t.is_overdue for t in results],
+            "due_this_week": [
+                t.days_until_due is not None and 0 <= t.days_until_due <= 7 and t.progress != "Done"
+                for t in results
+            ],
+        })
+
+    def summarize_frame(self, df) -> tuple[ReportSummary, dict]:
+        """generate_summary and calculate_sprint_metrics over a results_frame, vectorized."""
+        now = datetime.now()
+        total = len(df)
+        summary = ReportSummary(
+            total_tasks=total,
+            report_date=now.strftime('%Y-%m-%d'),
+            generated_at=now.isoformat()
+        )
+        if not total:
+            return summary, self.calculate_sprint_metrics([])
+
+        for column, summary_field in self._SUMMARY_FLAG_FIELDS:
+            setattr(summary, summary_field, int(df[column].sum()))
+
+        needs_update = df["needs_daily_update"]
+        summary.tasks_needing_updates = summary.tasks_active = int(needs_update.sum())
+        summary.tasks_missing_updates = int((needs_update & df["missing_daily_update"]).sum())
+        summary.overdue_points = float(df.loc[df["is_overdue"], "points"].sum())
+        summary.due_this_week_points = float(df.loc[df["due_this_week"], "points"].sum())
+        summary.compliance_rate = (summary.compliant_tasks / total) * 100
+
+        # Groups keep first-appearance order and the sorts are stable, matching
+        # the dict-building loops
+        by_assignee = (
+            df.assign(issues=~df["is_compliant"])
+            .groupby("assignee", sort=False, dropna=False)
+            .agg(total=("is_compliant", "size"), issues=("issues", "sum"))
+            .sort_values("issues", ascending=False, kind="stable")
+        )
+        summary.by_assignee = {
+            # dropna=False groups a missing assignee under NaN; generate_summary keys it None
+            (None if isinstance(a, float) else a): {"total": int(n), "issues": int(issues)}
+            for a, n, issues in zip(by_assignee.index, by_assignee["total"], by_assignee["issues"])
+        }
+
+        status = df["progress"].fillna("Unknown").replace("", "Unknown")
+        total_points = float(df["points"].sum())
+        completed_points = float(df.loc[status == "Done", "points"].sum())
+        by_status = df["points"].groupby(status, sort=False)
+        points_by_assignee = (
+            df["points"].groupby(df["assignee"].fillna("Unassigned").replace("", "Unassigned"), sort=False)
+            .sum()
+            .sort_values(ascending=False, kind="stable")
+        )
+        metrics = {
+            "total_points": total_points,
+            "completed_points": completed_points,
+            "remaining_points": total_points - completed_points,
+            "points_by_status": {k: float(v) for k, v in by_status.sum().items()},
+            "tasks_by_status": {k: int(v) for k, v in by_status.size().items()},
+            "points_by_assignee": {k: float(v) for k, v in points_by_assignee.items()},
+            "avg_points_per_task": round(total_points / total, 1),
+        }
+        return summary, metrics
+
 
 # =============================================================================
 # Report Generators
@@ -976,7 +1130,7 @@ class MarkdownReportGenerator:
             lines.append("| Task | Assignee | Sprint | Progress | Link |")
             lines.append("|------|----------|--------|----------|------|")
             for t in missing_epic:
-                name = t.name.replace("|", "-")[:50]
+                name = shorten(t.name.replace("|", "-"), 50)
                 lines.append(f"| {name} | {t.assignee} | {t.sprint or 'None'} | {t.progress or 'None'} | [Open]({t.url}) |")
         else:
             lines.append("[OK] All tasks have Epic assigned")
@@ -990,7 +1144,7 @@ class MarkdownReportGenerator:
             lines.append("| Task | Assignee | Epic | Progress | Link |")
             lines.append("|------|----------|------|----------|------|")
             for t in missing_sprint:
-                name = t.name.replace("|", "-")[:50]
+                name = shorten(t.name.replace("|", "-"), 50)
                 lines.append(f"| {name} | {t.assignee} | {t.epic or 'None'} | {t.progress or 'None'} | [Open]({t.url}) |")
         else:
             lines.append("[OK] All tasks have Sprint assigned")
@@ -1004,7 +1158,7 @@ class MarkdownReportGenerator:
             lines.append("| Task | Assignee | Progress | Link |")
             lines.append("|------|----------|----------|------|")
             for t in missing_type:
-                name = t.name.replace("|", "-")[:50]
+                name = shorten(t.name.replace("|", "-"), 50)
                 lines.append(f"| {name} | {t.assignee} | {t.progress or 'None'} | [Open]({t.url}) |")
         else:
             lines.append("[OK] All tasks have Type assigned")
@@ -1018,7 +1172,7 @@ class MarkdownReportGenerator:
             lines.append("| Task | Assignee | Type | Progress | Link |")
             lines.append("|------|----------|------|----------|------|")
             for t in missing_points:
-                name = t.name.replace("|", "-")[:50]
+                name = shorten(t.name.replace("|", "-"), 50)
                 lines.append(f"| {name} | {t.assignee} | {t.task_type or 'None'} | {t.progress or 'None'} | [Open]({t.url}) |")
         else:
             lines.append("[OK] All tasks have Story Points assigned")
@@ -1032,7 +1186,7 @@ class MarkdownReportGenerator:
             lines.append("| Task | Assignee | Type | Progress | Link |")
             lines.append("|------|----------|------|----------|------|")
             for t in missing_severity:
-                name = t.name.replace("|", "-")[:50]
+                name = shorten(t.name.replace("|", "-"), 50)
                 lines.append(f"| {name} | {t.assignee} | {t.task_type or 'None'} | {t.progress or 'None'} | [Open]({t.url}) |")
         else:
             lines.append("[OK] All tasks have Severity assigned")
@@ -1046,7 +1200,7 @@ class MarkdownReportGenerator:
             lines.append("| Task | Assignee | Sprint | Progress | Link |")
             lines.append("|------|----------|--------|----------|------|")
             for t in missing_due:
-                name = t.name.replace("|", "-")[:50]
+                name = shorten(t.name.replace("|", "-"), 50)
                 lines.append(f"| {name} | {t.assignee} | {t.sprint or 'None'} | {t.progress or 'None'} | [Open]({t.url}) |")
         else:
             lines.append("[OK] All tasks have Due Date set")
@@ -1061,7 +1215,7 @@ class MarkdownReportGenerator:
             lines.append("| Task | Assignee | Chars | Progress | Link |")
             lines.append("|------|----------|-------|----------|------|")
             for t in missing_desc:
-                name = t.name.replace("|", "-")[:50]
+                name = shorten(t.name.replace("|", "-"), 50)
                 lines.append(f"| {name} | {t.assignee} | {t.description_length} | {t.progress or 'None'} | [Open]({t.url}) |")
         else:
             lines.append("[OK] All tasks have adequate descriptions")
@@ -1271,7 +1425,7 @@ class HTMLReportGenerator:
             </tr>"""
 
             for t in missing_updates:
-                name = t.name[:50] if len(t.name) > 50 else t.name
+                name = shorten(t.name, 50)
                 last_update = t.last_comment_date[:10] if t.last_comment_date else "Never"
                 hours = f"{t.hours_since_update:.0f}h ago" if t.hours_since_update else "N/A"
                 html += f"""
@@ -1312,7 +1466,7 @@ class HTMLReportGenerator:
             </tr>"""
 
                 for t in tasks[:20]:  # Limit to 20 per section
-                    name = t.name[:50] if len(t.name) > 50 else t.name
+                    name = shorten(t.name, 50)
                     html += f"""
             <tr>
                 <td>{name}</td>
@@ -1388,8 +1542,15 @@ class ExcelReportGenerator:
 
     def __init__(self, config: Config):
         self.config = config
+        self._valid_points = frozenset(config.valid_story_points)
+        self._styles_ready = False
+
+    def _init_styles(self):
+        """Create the shared cell styles (imports openpyxl on first Excel export)."""
+        if self._styles_ready:
+            return
+        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 
-        # Styles
         self.header_font = Font(bold=True, color="FFFFFF", size=11)
         self.header_fill = PatternFill(start_color="667EEA", end_color="667EEA", fill_type="solid")
         self.warning_fill = PatternFill(start_color="FEF3C7", end_color="FEF3C7", fill_type="solid")
@@ -1406,6 +1567,10 @@ class ExcelReportGenerator:
             top=Side(style='thin', color='E5E7EB'),
             bottom=Side(style='thin', color='E5E7EB')
         )
+        self.header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        self.cell_alignment = Alignment(vertical='center', wrap_text=True)
+        self.bold_font = Font(bold=True)
+        self._styles_ready = True
 
     def _style_header_row(self, ws, row: int, num_cols: int):
         """Apply header styling to a row."""
@@ -1413,7 +1578,7 @@ class ExcelReportGenerator:
             cell = ws.cell(row=row, column=col)
             cell.font = self.header_font
             cell.fill = self.header_fill
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+            cell.alignment = self.header_alignment
             cell.border = self.thin_border
 
     def _auto_adjust_columns(self, ws):
@@ -1435,7 +1600,7 @@ class ExcelReportGenerator:
     def _add_task_row(self, ws, row: int, task: TaskCompliance, columns: list[str]):
         """Add a task row with data and styling."""
         col_data = {
-            'Task Name': task.name[:60] if len(task.name) > 60 else task.name,
+            'Task Name': shorten(task.name, 60),
             'Assignee': task.assignee,
             'Progress': task.progress or 'None',
             'Status': task.status_label,
@@ -1465,7 +1630,7 @@ class ExcelReportGenerator:
         for col_idx, col_name in enumerate(columns, 1):
             cell = ws.cell(row=row, column=col_idx, value=col_data.get(col_name, ''))
             cell.border = self.thin_border
-            cell.alignment = Alignment(vertical='center', wrap_text=True)
+            cell.alignment = self.cell_alignment
 
             # Add hyperlink for Link column
             if col_name == 'Link':
@@ -1503,11 +1668,13 @@ class ExcelReportGenerator:
             if col_name == 'Days Overdue' and task.is_overdue:
                 cell.fill = self.danger_fill
 
-    def generate(self, results: list[TaskCompliance], summary: ReportSummary) -> Workbook:
+    def generate(self, results: list[TaskCompliance], summary: ReportSummary) -> 'Workbook':
         """Generate Excel workbook with multiple sheets."""
         if not OPENPYXL_AVAILABLE:
             raise ImportError("openpyxl is required for Excel reports. Install with: pip install openpyxl")
+        from openpyxl import Workbook
 
+        self._init_styles()
         wb = Workbook()
 
         # ===== Sheet 1: Summary =====
@@ -1840,9 +2007,8 @@ class ExcelReportGenerator:
         if not task.story_points:
             return False, ""
 
-        try:
-            points = float(task.story_points)
-        except (ValueError, TypeError):
+        points = task.points
+        if math.isnan(points):
             return True, "Non-numeric value"
 
         # Bug or Epic with story points
@@ -1850,7 +2016,7 @@ class ExcelReportGenerator:
             return True, f"{task.task_type} should not have points"
 
         # Non-Fibonacci number
-        if points != int(points) or int(points) not in self.config.valid_story_points:
+        if points not in self._valid_points:
             return True, f"Non-Fibonacci ({task.story_points})"
 
         return False, ""
@@ -1875,7 +2041,7 @@ class ExcelReportGenerator:
                 invalid_tasks.append((task, reason))
 
         # Sort by assignee then by points
-        invalid_tasks.sort(key=lambda x: (x[0].assignee or "ZZZ", -(float(x[0].story_points or 0))))
+        invalid_tasks.sort(key=lambda x: (x[0].assignee or "\uffff", -x[0].points_or_zero))
 
         ws_invalid = wb.create_sheet("Invalid Story Points")
         invalid_columns = ['Task Name', 'Assignee', 'Type', 'Story Points', 'Issue',
@@ -1888,7 +2054,7 @@ class ExcelReportGenerator:
         for row_idx, (task, reason) in enumerate(invalid_tasks, 2):
             # Custom row handling to include the reason
             col_data = {
-                'Task Name': task.name[:60] if len(task.name) > 60 else task.name,
+                'Task Name': shorten(task.name, 60),
                 'Assignee': task.assignee or 'Unassigned',
                 'Type': task.task_type or 'None',
                 'Story Points': task.story_points or 'None',
@@ -1901,7 +2067,7 @@ class ExcelReportGenerator:
             for col_idx, col_name in enumerate(invalid_columns, 1):
                 cell = ws_invalid.cell(row=row_idx, column=col_idx, value=col_data.get(col_name, ''))
                 cell.border = self.thin_border
-                cell.alignment = Alignment(vertical='center', wrap_text=True)
+                cell.alignment = self.cell_alignment
 
                 # Highlight the issue column in red
                 if col_name == 'Issue':
@@ -1922,11 +2088,7 @@ class ExcelReportGenerator:
             assignee_invalid_points = {}
             for task, _ in invalid_tasks:
                 assignee = task.assignee or "Unassigned"
-                try:
-                    points = float(task.story_points) if task.story_points else 0
-                except (ValueError, TypeError):
-                    points = 0
-                assignee_invalid_points[assignee] = assignee_invalid_points.get(assignee, 0) + points
+                assignee_invalid_points[assignee] = assignee_invalid_points.get(assignee, 0) + task.points_or_zero
 
             # Add a summary sheet for invalid points by assignee
             ws_invalid_summary = wb.create_sheet("Invalid Points Summary")
@@ -1953,9 +2115,9 @@ class ExcelReportGenerator:
             # Add total row
             total_invalid_points = sum(assignee_invalid_points.values())
             total_invalid_tasks = len(invalid_tasks)
-            ws_invalid_summary.cell(row=row_idx, column=1, value="TOTAL").font = Font(bold=True)
-            ws_invalid_summary.cell(row=row_idx, column=2, value=total_invalid_points).font = Font(bold=True)
-            ws_invalid_summary.cell(row=row_idx, column=3, value=total_invalid_tasks).font = Font(bold=True)
+            ws_invalid_summary.cell(row=row_idx, column=1, value="TOTAL").font = self.bold_font
+            ws_invalid_summary.cell(row=row_idx, column=2, value=total_invalid_points).font = self.bold_font
+            ws_invalid_summary.cell(row=row_idx, column=3, value=total_invalid_tasks).font = self.bold_font
 
             self._auto_adjust_columns(ws_invalid_summary)
 
@@ -1969,9 +2131,15 @@ class ExcelReportGenerator:
 class AsanaComplianceReporter:
     """Main application."""
 
-    def __init__(self, access_token: str, config: Optional[Config] = None):
+    def __init__(
+        self,
+        access_token: str,
+        config: Optional[Config] = None,
+        client: Optional[AsanaClient] = None,
+    ):
         self.config = config or Config()
-        self.client = AsanaClient(access_token, self.config)
+        # A shared client reuses its API connection pool across reporters
+        self.client = client or AsanaClient(access_token, self.config)
         self.analyzer = ComplianceAnalyzer(self.config, self.client)
 
         self.generators = {
@@ -2053,6 +2221,9 @@ class AsanaComplianceReporter:
 def print_console_summary(summary: ReportSummary):
     """Print summary to console."""
     if RICH_AVAILABLE:
+        from rich.console import Console
+        from rich.table import Table
+
         console = Console()
 
         table = Table(title=f"Compliance Summary - {summary.report_date}")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Build the minified dashboard stylesheet
+========================================
+Minifies static/neumorphism.css into static/neumorphism.min.css, which the
+app serves when APP_ENV is "prod". Run after editing the stylesheet:
+
+    python build_css.py
+
+Uses only the standard library (comment stripping and whitespace folding),
+so no extra build dependency is needed.
+"""
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+
+STATIC_DIR = Path(__file__).parent / "static"
+SRC_CSS = STATIC_DIR / "neumorphism.css"
+MIN_CSS = STATIC_DIR / "neumorphism.min.css"
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    # No space is needed around block/declaration punctuation or child combinators
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    # Keep the space *before* ':' (it matters in selectors like "div :hover")
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    return css.strip() + "\n"
+
+
+def main() -> int:
+    src = SRC_CSS.read_text()
+    minified = minify_css(src)
+    MIN_CSS.write_text(minified)
+    print(f"{MIN_CSS.name}: {len(src):,} -> {len(minified):,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())